@@ -1,18 +1,40 @@
 """Application configuration using Pydantic Settings."""
 
-import json
-from functools import lru_cache
-from pathlib import Path
-from typing import Annotated, Any, ClassVar
-
-from pydantic import Field, PostgresDsn, RedisDsn, field_validator, model_validator
+import os
+from collections.abc import Mapping
+from typing import Annotated, Any, ClassVar, Self
+
+import orjson
+from pydantic import (
+    Field,
+    PostgresDsn,
+    PrivateAttr,
+    RedisDsn,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
+_PROD_ENVS = frozenset({"prod", "production"})
+_INSECURE_DEFAULTS: frozenset[str] = frozenset({
+    "replace-this-secret-key-with-at-least-32-characters",
+    "change-me-in-production-min-32-chars",
+})
+_SECRET_READ_SIZE = 4096
+
 
 def _read_secret_file(path: str, env_name: str) -> str:
     """Read a secret value from file and return stripped content."""
+    # Secrets are tiny; a raw fd read avoids the io/TextIOWrapper layers.
     try:
-        value = Path(path).read_text(encoding="utf-8").strip()
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            chunks = [os.read(fd, _SECRET_READ_SIZE)]
+            while len(chunks[-1]) == _SECRET_READ_SIZE:
+                chunks.append(os.read(fd, _SECRET_READ_SIZE))
+        finally:
+            os.close(fd)
+        value = b"".join(chunks).decode("utf-8").strip()
     except OSError as exc:
         raise ValueError(f"{env_name} points to unreadable file: {path}") from exc
 
@@ -22,6 +44,27 @@ def _read_secret_file(path: str, env_name: str) -> str:
     return value
 
 
+def _split_list(value: Any, env_name: str) -> Any:
+    """Parse a list setting from a comma-separated string, JSON array, or list."""
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return []
+        if value.startswith("["):
+            try:
+                parsed = orjson.loads(value)
+            except orjson.JSONDecodeError as exc:
+                raise ValueError(f"{env_name} is not valid JSON: {exc}") from exc
+            if not isinstance(parsed, list):
+                raise ValueError(f"{env_name} JSON value must be a list")
+            value = parsed
+        else:
+            return [item.strip() for item in value.split(",") if item.strip()]
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return value
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -53,6 +96,9 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = Field(default=20, description="Database connection pool size")
     database_max_overflow: int = Field(default=10, description="Max overflow for connection pool")
+    database_pool_recycle: int = Field(
+        default=1800, description="Seconds after which pooled connections are replaced"
+    )
 
     # Redis
     redis_url: RedisDsn = Field(
@@ -349,42 +395,6 @@ class Settings(BaseSettings):
         ),
     )
 
-    @field_validator("cors_origins", mode="before")
-    @classmethod
-    def parse_cors_origins(cls, v: Any) -> list[str]:
-        """Parse CORS origins from string or list."""
-        if isinstance(v, str):
-            value = v.strip()
-            if not value:
-                return []
-            if value.startswith("["):
-                parsed = json.loads(value)
-                if not isinstance(parsed, list):
-                    raise ValueError("CORS_ORIGINS JSON value must be a list")
-                return [str(origin).strip() for origin in parsed if str(origin).strip()]
-            return [origin.strip() for origin in value.split(",") if origin.strip()]
-        if isinstance(v, list):
-            return [str(origin).strip() for origin in v if str(origin).strip()]
-        return v
-
-    @field_validator("trusted_proxy_ips", mode="before")
-    @classmethod
-    def parse_trusted_proxy_ips(cls, v: Any) -> list[str]:
-        """Parse trusted proxy IPs from comma-separated string or list."""
-        if isinstance(v, str):
-            value = v.strip()
-            if not value:
-                return []
-            if value.startswith("["):
-                parsed = json.loads(value)
-                if not isinstance(parsed, list):
-                    raise ValueError("TRUSTED_PROXY_IPS JSON value must be a list")
-                return [str(ip).strip() for ip in parsed if str(ip).strip()]
-            return [ip.strip() for ip in value.split(",") if ip.strip()]
-        if isinstance(v, list):
-            return [str(ip).strip() for ip in v if str(ip).strip()]
-        return v
-
     # Hier wird LLM_PROVIDER schon beim App-Start gegen das erlaubte Set
     # geprueft, statt erst beim ersten LLM-Call in llm/factory.py zu
     # scheitern. Kleinschreibung + Strip ist tolerant; Bindestrich/
@@ -419,11 +429,19 @@ class Settings(BaseSettings):
     @model_validator(mode="before")
     @classmethod
     def load_secrets_from_files(cls, data: Any) -> Any:
-        """Allow *_FILE settings to populate sensitive values from mounted secrets."""
+        """Normalize raw input in one pass before field validation.
+
+        Allows *_FILE settings to populate sensitive values from mounted
+        secrets and parses the list-valued CORS_ORIGINS / TRUSTED_PROXY_IPS.
+        """
         if not isinstance(data, dict):
             return data
 
         settings = dict(data)
+        for list_field in ("cors_origins", "trusted_proxy_ips"):
+            if list_field in settings:
+                settings[list_field] = _split_list(settings[list_field], list_field.upper())
+
         file_mapping = {
             "database_url_file": "database_url",
             "api_secret_key_file": "api_secret_key",
@@ -439,30 +457,66 @@ class Settings(BaseSettings):
 
         return settings
 
+    # str() on a pydantic URL re-assembles it from its components on every
+    # call, so the rendered strings are cached.  _refresh_derived fills them
+    # after validation and again whenever a source field changes, by
+    # assignment or model_copy(update=...).
+    _DERIVED_FROM: ClassVar[frozenset[str]] = frozenset({"database_url", "redis_url", "env"})
+    _database_url_str: str = PrivateAttr(default="")
+    _redis_url_str: str = PrivateAttr(default="")
+    # Environment flags, derived from env the same way.
+    _is_production: bool = PrivateAttr(default=False)
+    _is_development: bool = PrivateAttr(default=False)
+
+    def _refresh_derived(self) -> None:
+        self._database_url_str = str(self.database_url)
+        self._redis_url_str = str(self.redis_url)
+        self._is_production = self.env in _PROD_ENVS
+        self._is_development = self.env == "development"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._DERIVED_FROM:
+            self._refresh_derived()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._refresh_derived()
+        return copied
+
+    @property
+    def database_url_s(self) -> str:
+        """DATABASE_URL as a plain string."""
+        return self._database_url_str
+
+    @property
+    def redis_url_s(self) -> str:
+        """REDIS_URL as a plain string."""
+        return self._redis_url_str
+
     @property
     def is_production(self) -> bool:
         """Check if running in production."""
-        return self.env in {"prod", "production"}
+        return self._is_production
 
     @property
     def is_development(self) -> bool:
         """Check if running in development."""
-        return self.env == "development"
+        return self._is_development
 
     @model_validator(mode="after")
     def validate_production_security(self) -> "Settings":
         """Enforce secure settings when running in production."""
-        if not self.is_production:
+        self._refresh_derived()
+
+        if not self._is_production:
             return self
 
-        insecure_defaults = {
-            "replace-this-secret-key-with-at-least-32-characters",
-            "change-me-in-production-min-32-chars",
-        }
-        if len(self.api_secret_key) < 32 or self.api_secret_key in insecure_defaults:
+        if len(self.api_secret_key) < 32 or self.api_secret_key in _INSECURE_DEFAULTS:
             raise ValueError("API_SECRET_KEY must be a strong non-default secret in production")
 
-        database_url_str = str(self.database_url)
+        database_url_str = self._database_url_str
         if "eki_password" in database_url_str or "replace-me" in database_url_str:
             raise ValueError("DATABASE_URL contains insecure placeholder credentials")
 
@@ -472,7 +526,12 @@ class Settings(BaseSettings):
         return self
 
 
-@lru_cache
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get cached settings instance (created on first call)."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
@@ -1,26 +1,35 @@
 """FastAPI dependency injection functions."""
 
+import asyncio
 import hashlib
 import logging
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 
 import redis.asyncio as aioredis
-from fastapi import Depends, Header, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from temporalio.client import Client as TemporalClient
 
 from api.config import Settings, get_settings
+from core.auth_types import AuthenticatedKey
 from core.db_models import ApiKeyModel
 from core.exceptions import ServiceUnavailableException
 from db.session import get_db_session
+from services.api_key_usage import record_usage
 
 logger = logging.getLogger(__name__)
 
 
 async def get_settings_dependency() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    Kept ``async`` on purpose: FastAPI runs plain ``def`` dependencies in
+    the threadpool, so a coroutine is the cheaper of the two here.
+    """
     return get_settings()
 
 
@@ -30,32 +39,70 @@ async def get_db() -> AsyncSession:
         yield session
 
 
+# One Redis client (and thus one connection pool) per process.
+# redis.asyncio.Redis is safe to share between coroutines; per-request
+# clients would tear down their pool after every request.
+_redis_client: aioredis.Redis | None = None
+
+
+def init_redis_pool(settings: Settings) -> aioredis.Redis:
+    """Create the shared Redis client on first use and return it."""
+    global _redis_client
+    if _redis_client is None:
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.redis_url_s,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=settings.redis_max_connections,
+        )
+        _redis_client = aioredis.Redis(connection_pool=pool)
+    return _redis_client
+
+
+async def close_redis_pool() -> None:
+    """Close the shared Redis client and disconnect its pool (app shutdown)."""
+    global _redis_client
+    if _redis_client is not None:
+        client, _redis_client = _redis_client, None
+        await client.aclose()
+        await client.connection_pool.disconnect()
+
+
 async def get_redis() -> aioredis.Redis:
-    """Get Redis connection."""
-    settings = get_settings()
-    redis_client = aioredis.from_url(
-        str(settings.redis_url),
-        encoding="utf-8",
-        decode_responses=True,
-        max_connections=settings.redis_max_connections,
-    )
-    try:
-        yield redis_client
-    finally:
-        await redis_client.aclose()
+    """Get the shared Redis client."""
+    yield _redis_client or init_redis_pool(get_settings())
+
+
+# Connecting to Temporal opens a gRPC channel and does a namespace
+# handshake, so the client is created once and shared by all requests.
+_temporal_client: TemporalClient | None = None
+_temporal_lock = asyncio.Lock()
+
+
+async def shared_temporal_client() -> TemporalClient:
+    """Return the process-wide Temporal client, connecting on first use.
+
+    A failed connect is not cached; the next call tries again.
+    """
+    global _temporal_client
+    if _temporal_client is None:
+        async with _temporal_lock:
+            if _temporal_client is None:
+                _temporal_client = await TemporalClient.connect(get_settings().temporal_host)
+    return _temporal_client
 
 
 async def get_temporal_client() -> TemporalClient:
-    """Get Temporal client.
+    """Get the shared Temporal client.
 
     Raises ServiceUnavailableException with a user-facing message when
     the Temporal server cannot be reached.
     """
-    settings = get_settings()
     try:
-        client = await TemporalClient.connect(settings.temporal_host)
+        client = await shared_temporal_client()
     except Exception as exc:
-        logger.error(f"Failed to connect to Temporal at {settings.temporal_host}: {exc}")
+        temporal_host = get_settings().temporal_host
+        logger.error(f"Failed to connect to Temporal at {temporal_host}: {exc}")
         raise ServiceUnavailableException(
             "Workflow engine is not reachable. Please try again later.",
             details={"service": "temporal"},
@@ -63,25 +110,134 @@ async def get_temporal_client() -> TemporalClient:
     yield client
 
 
+def reset_temporal_client() -> None:
+    """Drop the shared Temporal client (app shutdown).
+
+    temporalio clients have no explicit close; releasing the last
+    reference closes the underlying channel.
+    """
+    global _temporal_client
+    _temporal_client = None
+
+
 _bearer_scheme = HTTPBearer(
     description="API key as Bearer token: `eki_<token>`",
 )
 
+# Process-local cache of validated API keys, keyed by the SHA-256 token hash.
+# Repeat callers within the TTL skip the database entirely.  There is no
+# explicit invalidation: deactivating a key (is_active = False) takes effect
+# once its cache entry expires, i.e. after at most
+# _API_KEY_CACHE_TTL_SECONDS in every process.
+_API_KEY_CACHE_TTL_SECONDS = 30
+_api_key_cache: TTLCache[str, AuthenticatedKey] = TTLCache(
+    maxsize=10_000, ttl=_API_KEY_CACHE_TTL_SECONDS
+)
+
+
+# In-flight database lookups for cache misses, see _lookup_api_key.
+_api_key_lookups: dict[str, asyncio.Future] = {}
+_LOOKUP_FAILED = object()
+
+
+_sha256 = hashlib.sha256
+
+
+def hash_api_key(token: str) -> str:
+    """Return the SHA-256 hex digest under which an API key is stored."""
+    return _sha256(token.encode()).hexdigest()
+
+
+# Lookup for a valid API key, built once at import.  Selecting plain columns
+# (not the entity) skips ORM hydration and the session identity map.
+# key_hash is covered by the unique index ix_api_keys_key_hash.
+_VERIFY_API_KEY_STMT = select(
+    ApiKeyModel.id,
+    ApiKeyModel.user_id,
+    ApiKeyModel.organization_id,
+    ApiKeyModel.expires_at,
+).where(
+    ApiKeyModel.key_hash == bindparam("key_hash"),
+    ApiKeyModel.is_active == True,  # noqa: E712
+    ApiKeyModel.expires_at > bindparam("now"),
+)
+
+
+def _expiry_timestamp(expires_at: datetime) -> float:
+    """Convert ``expires_at`` to epoch seconds (naive values are UTC)."""
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return expires_at.timestamp()
+
+
+async def _query_api_key(
+    db: AsyncSession, token_hash: str, now: float
+) -> AuthenticatedKey | None:
+    result = await db.execute(
+        _VERIFY_API_KEY_STMT,
+        {"key_hash": token_hash, "now": datetime.fromtimestamp(now, UTC)},
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    api_key = AuthenticatedKey(
+        id=row.id,
+        user_id=row.user_id,
+        organization_id=row.organization_id,
+        expires_at=_expiry_timestamp(row.expires_at),
+    )
+    _api_key_cache[token_hash] = api_key
+    return api_key
+
+
+async def _lookup_api_key(
+    db: AsyncSession, token_hash: str, now: float
+) -> AuthenticatedKey | None:
+    """Resolve a cache miss with at most one in-flight query per key hash.
+
+    Concurrent misses for the same key (a burst right after startup or
+    after the TTL expired) wait for the first caller's result instead of
+    each querying the database.  If that query fails, waiters fall back
+    to their own query so they see their own error.
+    """
+    pending = _api_key_lookups.get(token_hash)
+    if pending is not None:
+        result = await asyncio.shield(pending)
+        if result is not _LOOKUP_FAILED:
+            return result
+        return await _query_api_key(db, token_hash, now)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _api_key_lookups[token_hash] = future
+    try:
+        api_key = await _query_api_key(db, token_hash, now)
+    except BaseException:
+        future.set_result(_LOOKUP_FAILED)
+        raise
+    else:
+        future.set_result(api_key)
+        return api_key
+    finally:
+        _api_key_lookups.pop(token_hash, None)
+
 
 async def verify_api_key(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
     db: AsyncSession = Depends(get_db),
-) -> ApiKeyModel:
+) -> AuthenticatedKey:
     """
     Verify API key against database.
 
-    Returns ApiKeyModel with user_id, organization_id, and usage tracking.
+    Returns an AuthenticatedKey (id, user_id, organization_id, expires_at).
 
     Security features:
     - API keys stored as SHA-256 hashes (never plaintext)
     - Expiration checking
     - Active status validation
-    - Usage tracking for monitoring
+    - Usage tracking for monitoring (in-process counters, see services.api_key_usage)
+    - Validated keys are cached for _API_KEY_CACHE_TTL_SECONDS; concurrent
+      misses for one key share a single lookup
     """
     token = credentials.credentials
 
@@ -92,30 +248,33 @@ async def verify_api_key(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Hash the token (API keys are stored hashed)
-    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    # Hash the token (API keys are stored hashed).  rate_limit_by_api_key
+    # runs first on most routes and leaves its digest on request.state.
+    hashed = getattr(request.state, "api_key_hash", None)
+    if hashed is not None and hashed[0] == token:
+        token_hash = hashed[1]
+    else:
+        token_hash = hash_api_key(token)
 
-    # Query database for valid API key
-    stmt = select(ApiKeyModel).where(
-        ApiKeyModel.key_hash == token_hash,
-        ApiKeyModel.is_active == True,  # noqa: E712
-        ApiKeyModel.expires_at > datetime.utcnow(),
-    )
+    # One clock read per request, used for the expiry check and last_used_at.
+    now = time.time()
 
-    result = await db.execute(stmt)
-    api_key = result.scalar_one_or_none()
+    api_key = _api_key_cache.get(token_hash)
+    if api_key is not None:
+        if api_key.expires_at > now:
+            record_usage(api_key.id, now)
+            return api_key
+        _api_key_cache.pop(token_hash, None)
 
-    if not api_key:
+    api_key = await _lookup_api_key(db, token_hash, now)
+    if api_key is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired API key",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last_used_at and usage_count for monitoring
-    api_key.last_used_at = datetime.utcnow()
-    api_key.usage_count += 1
-    await db.commit()
+    record_usage(api_key.id, now)
 
     return api_key
 
@@ -127,7 +286,7 @@ def get_actor_headers(
     x_actor_project_id: str | None = Header(
         None, description="Actor project ID", include_in_schema=False,
     ),
-    api_key: ApiKeyModel = Depends(verify_api_key),
+    api_key: AuthenticatedKey = Depends(verify_api_key),
 ) -> dict[str, str | None]:
     """
     Extract actor information from headers for audit logging.
@@ -1,30 +1,41 @@
 """Main FastAPI application instance."""
 
+import asyncio
+import contextlib
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from fastapi.openapi.utils import get_openapi
 
 from api.config import get_settings
-from api.dependencies import verify_api_key
+from api.dependencies import (
+    close_redis_pool,
+    init_redis_pool,
+    reset_temporal_client,
+    verify_api_key,
+)
+from api.middleware import CORSMiddleware
+from api.rate_limiting import load_rate_limit_scripts
+from api.responses import ORJSONResponse
 from api.routers import health, knowledge_base, security
+from core.auth_types import AuthenticatedKey
 from core.exceptions import EKIException
-from core.db_models import ApiKeyModel
 from core.logging_config import configure_logging, set_request_id
 from core.models import (
     AsyncSecurityCheckRequest,
-    ErrorDetail,
-    ErrorResponse,
     SecurityCheckRequest,
+    utcnow,
 )
+from db.session import AsyncSessionFactory
+from llm.factory import close_llm_providers
+from services.api_key_usage import run_usage_flusher
 
 # M08: zentrale Logging-Konfiguration. Setzt strukturierte JSON-Logs
 # (Default) oder Console-Renderer (LOG_FORMAT=console) und installiert
@@ -41,11 +52,24 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Starting eKI API v0.6.0 in {settings.env} environment")
 
     # Startup: Initialize connections, etc.
+    redis_client = init_redis_pool(settings)
+    try:
+        await load_rate_limit_scripts(redis_client)
+    except Exception:
+        logger.warning("Could not preload rate limit scripts – loading on first use", exc_info=True)
+    usage_flusher = asyncio.create_task(run_usage_flusher(redis_client, AsyncSessionFactory))
     logger.info("Application startup complete")
 
     yield
 
-    # Shutdown: Clean up resources
+    # Shutdown: Clean up resources.  The flusher pushes its last in-process
+    # counts to Redis when cancelled; they are persisted by the next flush.
+    usage_flusher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await usage_flusher
+    await close_redis_pool()
+    await close_llm_providers()
+    reset_temporal_client()
     logger.info("Application shutdown complete")
 
 
@@ -121,43 +145,82 @@ def _is_infrastructure_error(exc: Exception) -> tuple[bool, str]:
     return False, ""
 
 
+def _error_content(
+    request: Request,
+    error: str,
+    message: str,
+    details: list[dict[str, str | None]] | None = None,
+) -> dict:
+    """Build an ``ErrorResponse``-shaped body as a plain dict.
+
+    Skips constructing and dumping the pydantic model on every error;
+    ``ErrorResponse`` stays the documented schema of this shape.
+    """
+    return {
+        "error": error,
+        "message": message,
+        "details": details or [],
+        "request_id": request.headers.get("X-Request-ID"),
+        "timestamp": utcnow(),
+    }
+
+
+def _error_detail(
+    message: str, field: str | None = None, error_code: str | None = None
+) -> dict[str, str | None]:
+    """Plain-dict counterpart of ``ErrorDetail``."""
+    return {"field": field, "message": message, "error_code": error_code}
+
+
+def _validation_details(errors: Sequence[Any]) -> list[dict[str, str | None]]:
+    return [
+        _error_detail(
+            err["msg"],
+            field=".".join(str(loc) for loc in err["loc"]) if err.get("loc") else None,
+            error_code=err["type"],
+        )
+        for err in errors
+    ]
+
+
 @app.exception_handler(EKIException)
-async def eki_exception_handler(request: Request, exc: EKIException) -> JSONResponse:
+async def eki_exception_handler(request: Request, exc: EKIException) -> ORJSONResponse:
     """Handle custom EKI exceptions with their specific status codes."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=ErrorResponse(
-            error=exc.__class__.__name__,
-            message=exc.message,
-            details=[ErrorDetail(message=str(v)) for v in exc.details.values()],
-            request_id=request.headers.get("X-Request-ID"),
-        ).model_dump(mode="json"),
+        content=_error_content(
+            request,
+            exc.__class__.__name__,
+            exc.message,
+            [_error_detail(str(v)) for v in exc.details.values()],
+        ),
     )
 
 
+_HTTP_ERROR_NAMES: dict[int, str] = {
+    400: "BadRequest",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "NotFound",
+    405: "MethodNotAllowed",
+    409: "Conflict",
+    410: "Gone",
+    413: "PayloadTooLarge",
+    422: "ValidationError",
+    429: "RateLimitExceeded",
+}
+
+
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Normalize FastAPI HTTPExceptions into the ErrorResponse format."""
-    error_name = {
-        400: "BadRequest",
-        401: "Unauthorized",
-        403: "Forbidden",
-        404: "NotFound",
-        405: "MethodNotAllowed",
-        409: "Conflict",
-        410: "Gone",
-        413: "PayloadTooLarge",
-        422: "ValidationError",
-        429: "RateLimitExceeded",
-    }.get(exc.status_code, "Error")
-
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=exc.status_code,
-        content=ErrorResponse(
-            error=error_name,
-            message=str(exc.detail),
-            request_id=request.headers.get("X-Request-ID"),
-        ).model_dump(mode="json"),
+        content=_error_content(
+            request,
+            _HTTP_ERROR_NAMES.get(exc.status_code, "Error"),
+            str(exc.detail),
+        ),
     )
 
     if exc.headers:
@@ -169,78 +232,56 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
-    details = [
-        ErrorDetail(
-            field=".".join(str(loc) for loc in err["loc"]),
-            message=err["msg"],
-            error_code=err["type"],
-        )
-        for err in exc.errors()
-    ]
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=ErrorResponse(
-            error="ValidationError",
-            message="Request validation failed",
-            details=details,
-            request_id=request.headers.get("X-Request-ID"),
-        ).model_dump(mode="json"),
+        content=_error_content(
+            request,
+            "ValidationError",
+            "Request validation failed",
+            _validation_details(exc.errors()),
+        ),
     )
 
 
 @app.exception_handler(ValidationError)
 async def pydantic_validation_exception_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle raw Pydantic ValidationError that bypassed FastAPI's wrapper."""
-    details = [
-        ErrorDetail(
-            field=".".join(str(loc) for loc in err["loc"]) if err.get("loc") else None,
-            message=err["msg"],
-            error_code=err["type"],
-        )
-        for err in exc.errors()
-    ]
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=ErrorResponse(
-            error="ValidationError",
-            message="Request validation failed",
-            details=details,
-            request_id=request.headers.get("X-Request-ID"),
-        ).model_dump(mode="json"),
+        content=_error_content(
+            request,
+            "ValidationError",
+            "Request validation failed",
+            _validation_details(exc.errors()),
+        ),
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions with infrastructure-aware classification."""
     is_infra, user_message = _is_infrastructure_error(exc)
 
     if is_infra:
         logger.error(f"Infrastructure error: {type(exc).__name__}: {exc}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content=ErrorResponse(
-                error="ServiceUnavailable",
-                message=user_message,
-                request_id=request.headers.get("X-Request-ID"),
-            ).model_dump(mode="json"),
+            content=_error_content(request, "ServiceUnavailable", user_message),
         )
 
     logger.error(f"Unexpected error: {exc}", exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            error="InternalServerError",
-            message="An internal error occurred. Please try again later.",
-            request_id=request.headers.get("X-Request-ID"),
-        ).model_dump(mode="json"),
+        content=_error_content(
+            request,
+            "InternalServerError",
+            "An internal error occurred. Please try again later.",
+        ),
     )
 
 
@@ -252,7 +293,7 @@ app.include_router(knowledge_base.router, prefix="/v1/kb", tags=["KnowledgeBase"
 if settings.metrics_enabled:
 
     @app.get("/metrics", include_in_schema=False)
-    async def metrics_endpoint(_api_key: ApiKeyModel = Depends(verify_api_key)) -> Response:
+    async def metrics_endpoint(_api_key: AuthenticatedKey = Depends(verify_api_key)) -> Response:
         """Prometheus metrics endpoint protected by API key authentication."""
         return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
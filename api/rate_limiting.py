@@ -3,15 +3,122 @@
 import hashlib
 import ipaddress
 import logging
+import math
+import secrets
+import time
+from dataclasses import dataclass
 
 import redis.asyncio as aioredis
 from fastapi import Depends, HTTPException, Request, status
+from redis.exceptions import NoScriptError
 
-from api.config import Settings, get_settings
-from api.dependencies import get_redis
+from api.config import Settings
+from api.dependencies import get_redis, get_settings_dependency, hash_api_key
 
 logger = logging.getLogger(__name__)
 
+# Sliding-window log: one ZSET member per accepted request, scored by its
+# time in ms.  Expired members are trimmed, then the request is admitted
+# only if fewer than ``limit`` remain, so there is no 2x burst at window
+# boundaries as with a fixed INCR counter.  Atomic and one round trip.
+# Every bucket in KEYS is checked first and all of them are charged only
+# when all admit the request, so a request rejected by one bucket (e.g. an
+# IP flood) never eats into another (e.g. the API key's hourly quota).
+# ARGV: now_ms, unique member suffix, then window_ms and limit per key.
+# Returns {allowed (0/1), retry_after_ms per key (0 = within limit)}.
+_SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local result = {1}
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[2 * i + 1])
+    local limit = tonumber(ARGV[2 * i + 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) < limit then
+        result[i + 1] = 0
+    else
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        result[1] = 0
+        result[i + 1] = tonumber(oldest[2]) + window - now
+    end
+end
+if result[1] == 1 then
+    for i, key in ipairs(KEYS) do
+        redis.call('ZADD', key, now, now .. ':' .. ARGV[2])
+        redis.call('PEXPIRE', key, ARGV[2 * i + 1])
+    end
+end
+return result
+"""
+_SLIDING_WINDOW_SHA = hashlib.sha1(_SLIDING_WINDOW_LUA.encode()).hexdigest()
+
+# Distinct from the old fixed-window string counters ("rate_limit:ip:...")
+# so a rolling deploy never runs ZSET commands against them (WRONGTYPE).
+_KEY_PREFIX = "rate_limit:sw:"
+
+
+async def load_rate_limit_scripts(redis: aioredis.Redis) -> None:
+    """Preload the Lua scripts so the first requests hit EVALSHA directly."""
+    await redis.script_load(_SLIDING_WINDOW_LUA)
+
+
+@dataclass(frozen=True, slots=True)
+class _Limit:
+    """One rate limit bucket to charge for the current request."""
+
+    key: str
+    limit: int
+    window: int  # seconds
+    detail: str
+
+
+async def _hit(redis: aioredis.Redis, limits: list[_Limit]) -> list[tuple[bool, int]]:
+    """Charge one request against all buckets atomically in one round trip.
+
+    Returns ``(allowed, retry_after_seconds)`` per bucket, in order.  The
+    request is only counted if every bucket allowed it.
+    """
+    keys = [lim.key for lim in limits]
+    argv: list[int | str] = [int(time.time() * 1000), secrets.token_hex(8)]
+    for lim in limits:
+        argv += [lim.window * 1000, lim.limit]
+
+    try:
+        result = await redis.evalsha(_SLIDING_WINDOW_SHA, len(keys), *keys, *argv)
+    except NoScriptError:
+        # Script cache was flushed (Redis restart / failover) – EVAL reloads it.
+        # EVALSHA failed, so nothing was counted yet.
+        result = await redis.eval(_SLIDING_WINDOW_LUA, len(keys), *keys, *argv)
+    return [
+        (int(retry_ms) == 0, max(1, math.ceil(int(retry_ms) / 1000)))
+        for retry_ms in result[1:]
+    ]
+
+
+async def _enforce(redis: aioredis.Redis, limits: list[_Limit], what: str) -> None:
+    """Charge *limits* and raise 429 if any of them is exceeded.
+
+    With several exceeded buckets the longest Retry-After wins.  Redis
+    errors are logged and the request is allowed.
+    """
+    try:
+        results = await _hit(redis, limits)
+    except Exception:
+        logger.warning(f"Redis unavailable for {what} – allowing request", exc_info=True)
+        return
+
+    exceeded = [
+        (lim, retry_after)
+        for lim, (allowed, retry_after) in zip(limits, results, strict=True)
+        if not allowed
+    ]
+    if exceeded:
+        lim, retry_after = max(exceeded, key=lambda item: item[1])
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=lim.detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
 
 def _client_ip_from_request(request: Request, settings: Settings) -> str:
     """
@@ -40,10 +147,44 @@ def _client_ip_from_request(request: Request, settings: Settings) -> str:
     return forwarded_ip
 
 
+def _ip_limit(request: Request, settings: Settings) -> _Limit:
+    client_ip = _client_ip_from_request(request, settings)
+    limit = max(1, settings.rate_limit_per_minute)
+    window = 60  # seconds
+    return _Limit(
+        key=f"{_KEY_PREFIX}ip:{client_ip}",
+        limit=limit,
+        window=window,
+        detail=f"Rate limit exceeded. Maximum {limit} requests per {window} seconds.",
+    )
+
+
+def _api_key_limit(request: Request, settings: Settings) -> _Limit | None:
+    auth_header = request.headers.get("Authorization", "")
+
+    # removeprefix returns the same object when the prefix is absent.
+    api_key = auth_header.removeprefix("Bearer ")
+    if api_key is auth_header or not api_key:
+        return None
+
+    token_hash = hash_api_key(api_key)
+    # Reused by verify_api_key for the same request.
+    request.state.api_key_hash = (api_key, token_hash)
+
+    limit = max(1, settings.rate_limit_per_hour)
+    window = 3600  # seconds (1 hour)
+    return _Limit(
+        key=f"{_KEY_PREFIX}api_key:{token_hash[:16]}",
+        limit=limit,
+        window=window,
+        detail=f"Rate limit exceeded. Maximum {limit} requests per {window // 60} minutes.",
+    )
+
+
 async def rate_limit_by_ip(
     request: Request,
     redis: aioredis.Redis = Depends(get_redis),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> None:
     """
     Rate limit by IP address.
@@ -56,35 +197,13 @@ async def rate_limit_by_ip(
     if not settings.rate_limit_enabled:
         return
 
-    client_ip = _client_ip_from_request(request, settings)
-
-    key = f"rate_limit:ip:{client_ip}"
-    limit = max(1, settings.rate_limit_per_minute)
-    window = 60  # seconds
-
-    try:
-        current = await redis.incr(key)
-
-        if current == 1:
-            await redis.expire(key, window)
-
-        if current > limit:
-            ttl = await redis.ttl(key)
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Maximum {limit} requests per {window} seconds.",
-                headers={"Retry-After": str(ttl if ttl > 0 else window)},
-            )
-    except HTTPException:
-        raise
-    except Exception:
-        logger.warning("Redis unavailable for IP rate limiting – allowing request", exc_info=True)
+    await _enforce(redis, [_ip_limit(request, settings)], "IP rate limiting")
 
 
 async def rate_limit_by_api_key(
     request: Request,
     redis: aioredis.Redis = Depends(get_redis),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> None:
     """
     Rate limit by API key (more generous than IP).
@@ -97,51 +216,31 @@ async def rate_limit_by_api_key(
     if not settings.rate_limit_enabled:
         return
 
-    auth_header = request.headers.get("Authorization", "")
-
-    if not auth_header.startswith("Bearer "):
-        return
-
-    api_key = auth_header[7:]
-    key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
-
-    key = f"rate_limit:api_key:{key_hash}"
-    limit = max(1, settings.rate_limit_per_hour)
-    window = 3600  # seconds (1 hour)
-
-    try:
-        current = await redis.incr(key)
-
-        if current == 1:
-            await redis.expire(key, window)
-
-        if current > limit:
-            ttl = await redis.ttl(key)
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Maximum {limit} requests per {window // 60} minutes.",
-                headers={"Retry-After": str(ttl if ttl > 0 else window)},
-            )
-    except HTTPException:
-        raise
-    except Exception:
-        logger.warning("Redis unavailable for API-key rate limiting – allowing request", exc_info=True)
+    api_key_limit = _api_key_limit(request, settings)
+    if api_key_limit is not None:
+        await _enforce(redis, [api_key_limit], "API-key rate limiting")
 
 
 async def rate_limit_combined(
     request: Request,
     redis: aioredis.Redis = Depends(get_redis),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_settings_dependency),
 ) -> None:
     """
     Combined rate limiting: strict IP limit + generous API key limit.
 
     IP-based: 60 req/min (prevents abuse without auth)
     API key: 1000 req/hour (generous for authenticated users)
+
+    Both buckets are checked in one atomic Redis script; neither is charged
+    unless both allow the request.
     """
-    # Always check IP rate limit
-    await rate_limit_by_ip(request, redis, settings)
+    if not settings.rate_limit_enabled:
+        return
+
+    limits = [_ip_limit(request, settings)]
+    api_key_limit = _api_key_limit(request, settings)
+    if api_key_limit is not None:
+        limits.append(api_key_limit)
 
-    # Check API key rate limit if authenticated
-    if "Authorization" in request.headers:
-        await rate_limit_by_api_key(request, redis, settings)
+    await _enforce(redis, limits, "rate limiting")
@@ -0,0 +1,20 @@
+"""Response classes shared by the API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Used where the app builds JSON from plain dicts (exception handlers,
+    prebuilt payloads).  Routes with a ``response_model`` don't need it:
+    FastAPI already serializes those straight to bytes via pydantic-core.
+    FastAPI's own ``ORJSONResponse`` is deprecated for that reason, hence
+    this small local copy.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
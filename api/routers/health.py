@@ -1,23 +1,37 @@
 """Health check endpoints."""
 
+import asyncio
 import logging
-from datetime import datetime
+import time
 
 import redis.asyncio as aioredis
 from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from temporalio.client import Client as TemporalClient
 
-from api.config import get_settings
-from api.dependencies import get_db, get_redis, verify_api_key
-from core.db_models import ApiKeyModel
-from core.models import HealthResponse, ReadinessResponse
+from api.dependencies import get_db, get_redis, shared_temporal_client, verify_api_key
+from core.auth_types import AuthenticatedKey
+from core.models import HealthResponse, ReadinessResponse, utcnow
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Upper bound for each dependency probe in readiness_check.
+_CHECK_TIMEOUT_SECONDS = 2.0
+
+# Probe results are reused for this long so bursty readiness probes (several
+# kubelets, load balancers, dashboards) don't each hit PG, Redis and Temporal.
+_READINESS_CACHE_SECONDS = 1.0
+
+# Constant parts of the serialized HealthResponse – see health_check.
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'","version":"0.6.0"}'
+
+# (monotonic timestamp, result) – see readiness_check.
+_readiness_cache: tuple[float, ReadinessResponse] | None = None
+_readiness_lock = asyncio.Lock()
+
 
 @router.get(
     "/health",
@@ -26,17 +40,58 @@ router = APIRouter()
     summary="Liveness probe",
     description="Simple health check that returns 200 if the service is running.",
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Liveness probe endpoint.
 
     Returns a simple health status indicating the service is alive.
     This endpoint does not check external dependencies.
+
+    Only the timestamp changes between probes, so it is spliced between
+    prebuilt byte strings; probes skip model validation and JSON encoding.
+    The timestamp keeps the full ISO 8601 form (with microseconds) that
+    ``HealthResponse`` serializes.
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow(),
-        version="0.6.0",
+    body = b"".join((_HEALTH_PREFIX, utcnow().isoformat().encode(), _HEALTH_SUFFIX))
+    return Response(content=body, media_type="application/json")
+
+
+async def _probe_dependencies(db: AsyncSession, redis: aioredis.Redis) -> ReadinessResponse:
+    """Check PostgreSQL, Redis and Temporal concurrently, each with a timeout."""
+
+    async def _check_db() -> None:
+        await db.execute(text("SELECT 1"))
+
+    async def _check_redis() -> None:
+        await redis.ping()
+
+    async def _check_temporal() -> None:
+        # Reuses the shared client; a real RPC health check, not just a connect.
+        client = await shared_temporal_client()
+        await client.service_client.check_health()
+
+    # Probes run concurrently, each bounded so one hung dependency cannot
+    # stall the orchestrator's readiness probe.
+    checks = {"database": _check_db, "redis": _check_redis, "temporal": _check_temporal}
+    results = await asyncio.gather(
+        *(asyncio.wait_for(check(), _CHECK_TIMEOUT_SECONDS) for check in checks.values()),
+        return_exceptions=True,
+    )
+
+    services_status: dict[str, bool] = {}
+    for name, result in zip(checks, results, strict=True):
+        services_status[name] = not isinstance(result, BaseException)
+        if isinstance(result, BaseException):
+            logger.warning(f"{name} readiness check failed: {result!r}")
+
+    # Determine overall status
+    all_ready = all(services_status.values())
+    overall_status = "ready" if all_ready else "not_ready"
+
+    return ReadinessResponse(
+        status=overall_status,
+        timestamp=utcnow(),
+        services=services_status,
     )
 
 
@@ -51,7 +106,7 @@ async def readiness_check(
     http_response: Response,
     db: AsyncSession = Depends(get_db),
     redis: aioredis.Redis = Depends(get_redis),
-    _api_key: ApiKeyModel = Depends(verify_api_key),
+    _api_key: AuthenticatedKey = Depends(verify_api_key),
 ) -> ReadinessResponse:
     """
     Readiness probe endpoint.
@@ -63,45 +118,25 @@ async def readiness_check(
 
     Returns 200 if all services are available, 503 otherwise.
     Temporal is checked inside the handler body so that a connection
-    failure does not crash the entire endpoint.
-    """
-    services_status: dict[str, bool] = {}
-
-    # Check database
-    try:
-        await db.execute(text("SELECT 1"))
-        services_status["database"] = True
-    except Exception:
-        services_status["database"] = False
-
-    # Check Redis
-    try:
-        await redis.ping()
-        services_status["redis"] = True
-    except Exception:
-        services_status["redis"] = False
-
-    # Check Temporal – connect and perform a real RPC health check
-    try:
-        settings = get_settings()
-        client = await TemporalClient.connect(settings.temporal_host)
-        await client.service_client.check_health()
-        services_status["temporal"] = True
-    except Exception:
-        logger.warning("Temporal health check failed", exc_info=True)
-        services_status["temporal"] = False
-
-    # Determine overall status
-    all_ready = all(services_status.values())
-    overall_status = "ready" if all_ready else "not_ready"
+    failure does not crash the entire endpoint.  The three checks run
+    concurrently with a per-check timeout.
 
-    readiness_response = ReadinessResponse(
-        status=overall_status,
-        timestamp=datetime.utcnow(),
-        services=services_status,
-    )
-
-    if not all_ready:
+    Results are cached for ``_READINESS_CACHE_SECONDS``; on expiry only one
+    request re-probes while concurrent callers wait on the lock and reuse
+    its result.
+    """
+    global _readiness_cache
+    cached = _readiness_cache
+    if cached is None or time.monotonic() - cached[0] >= _READINESS_CACHE_SECONDS:
+        async with _readiness_lock:
+            # Another request may have refreshed the cache while we waited.
+            cached = _readiness_cache
+            if cached is None or time.monotonic() - cached[0] >= _READINESS_CACHE_SECONDS:
+                result = await _probe_dependencies(db, redis)
+                cached = _readiness_cache = (time.monotonic(), result)
+
+    readiness_response = cached[1]
+    if readiness_response.status != "ready":
         http_response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
     return readiness_response
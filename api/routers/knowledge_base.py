@@ -23,7 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.config import get_settings
 from api.dependencies import get_db, verify_api_key
 from api.rate_limiting import rate_limit_combined
-from core.db_models import ApiKeyModel
+from core.auth_types import AuthenticatedKey
 from core.exceptions import (
     ConflictException,
     NotFoundException,
@@ -148,7 +148,7 @@ async def upload_document(
     source: str = Form("UPLOAD", description="UPLOAD | SHARE | URL | PLACEHOLDER"),
     tags: str | None = Form(None, description="Comma-separated tags"),
     ttl_hours: int = Form(720, ge=_MIN_TTL_HOURS, le=_MAX_TTL_HOURS),
-    api_key: ApiKeyModel = Depends(verify_api_key),
+    api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
 ) -> KBDocumentResponse:
     raw = await file.read()
@@ -192,7 +192,7 @@ async def list_documents(
     tag: str | None = None,
     limit: int = 100,
     offset: int = 0,
-    _api_key: ApiKeyModel = Depends(verify_api_key),
+    _api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
 ) -> KBListResponse:
     if limit < 1 or limit > 500:
@@ -228,7 +228,7 @@ async def list_documents(
 )
 async def get_document(
     doc_id: UUID = Path(..., description="Document ID"),
-    _api_key: ApiKeyModel = Depends(verify_api_key),
+    _api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
 ) -> KBDocumentResponse:
     svc = _service(db)
@@ -251,7 +251,7 @@ async def get_document(
 )
 async def delete_document(
     doc_id: UUID = Path(..., description="Document ID"),
-    _api_key: ApiKeyModel = Depends(verify_api_key),
+    _api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
 ) -> KBDeleteResponse:
     svc = _service(db)
@@ -278,7 +278,7 @@ async def delete_document(
 )
 async def delete_documents_by_tag(
     tag: str,
-    _api_key: ApiKeyModel = Depends(verify_api_key),
+    _api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
 ) -> KBDeleteByTagResponse:
     if not tag.strip():
@@ -5,7 +5,7 @@ file uploads.  Sensitive data is stored in the encrypted SecureBuffer (Redis)
 and only opaque reference keys are passed to Temporal workflows.
 """
 
-import base64
+import asyncio
 import logging
 import uuid
 from dataclasses import dataclass
@@ -21,12 +21,15 @@ from fastapi import (
     HTTPException,
     Path,
     Request,
+    Response,
     UploadFile,
     status,
 )
 from pydantic import ValidationError
-from sqlalchemy import select, update
+from sqlalchemy import Row, Select, func, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Message, Receive
 from temporalio.client import Client as TemporalClient
 
 from api.config import get_settings
@@ -38,7 +41,9 @@ from api.dependencies import (
     verify_api_key,
 )
 from api.rate_limiting import rate_limit_combined
-from core.db_models import ApiKeyModel, JobMetadata, ReportMetadata
+from api.responses import ORJSONResponse
+from core.auth_types import AuthenticatedKey
+from core.db_models import JobMetadata, ReportMetadata
 from core.models import (
     AsyncSecurityCheckRequest,
     AsyncSecurityCheckResponse,
@@ -50,6 +55,7 @@ from core.models import (
     SecurityCheckRequest,
     SecurityReport,
     SyncSecurityCheckResponse,
+    utcnow,
 )
 from core.exceptions import ServiceUnavailableException
 from services.secure_buffer import SecureBuffer
@@ -64,6 +70,13 @@ router = APIRouter()
 _MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
 
 
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Allowance on top of the file size for multipart boundaries, part headers
+# and the small form fields sent alongside the file.
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
 def _max_upload_size() -> int:
     """Resolve effective max upload size from settings, falling back to 10 MB."""
     try:
@@ -77,20 +90,32 @@ def _max_upload_size() -> int:
 # ---------------------------------------------------------------------------
 
 
+# SecureBuffer bound to the shared Redis client (see api.dependencies.get_redis),
+# so the cipher keys are derived once per process instead of once per request.
+# Rebuilt only when a different client is passed in (dependency overrides).
+_buffer_cache: tuple[aioredis.Redis, SecureBuffer] | None = None
+
+
 def _get_buffer(redis_client: aioredis.Redis) -> SecureBuffer:
-    settings = get_settings()
-    return SecureBuffer(
-        redis_client,
-        secret_key=settings.api_secret_key,
-        default_ttl=settings.buffer_ttl_seconds,
-    )
+    global _buffer_cache
+    if _buffer_cache is None or _buffer_cache[0] is not redis_client:
+        settings = get_settings()
+        _buffer_cache = (
+            redis_client,
+            SecureBuffer(
+                redis_client,
+                secret_key=settings.api_secret_key,
+                default_ttl=settings.buffer_ttl_seconds,
+            ),
+        )
+    return _buffer_cache[1]
 
 
 @dataclass
 class ResolvedRequest:
     """Parsed request data from JSON or multipart."""
 
-    b64_content: str
+    content: bytes
     script_format: ScriptFormat
     project_id: str
     metadata: dict[str, Any]
@@ -100,18 +125,33 @@ class ResolvedRequest:
     script_id: int | None = None
 
 
-async def _resolve_request(request: Request) -> ResolvedRequest:
-    """Inspect Content-Type and parse the request into a ResolvedRequest."""
-    ct = (request.headers.get("content-type") or "").lower()
-    if "multipart/form-data" in ct:
+_MULTIPART_PREFIX = "multipart/form-data"
+_MULTIPART_PREFIX_LEN = len(_MULTIPART_PREFIX)
+
+
+async def _resolve_request(
+    request: Request,
+    model: type[SecurityCheckRequest] = SecurityCheckRequest,
+) -> ResolvedRequest:
+    """Inspect Content-Type and parse the request into a ResolvedRequest.
+
+    JSON bodies are validated against *model*; the async endpoint passes
+    ``AsyncSecurityCheckRequest`` so ``priority`` is range-checked too.
+    """
+    # Media types are case-insensitive; only the (short) prefix is lowered.
+    ct = request.headers.get("content-type", "")
+    if ct[:_MULTIPART_PREFIX_LEN].lower() == _MULTIPART_PREFIX:
         return await _resolve_multipart(request)
-    return await _resolve_json(request)
+    return await _resolve_json(request, model)
 
 
-async def _resolve_json(request: Request) -> ResolvedRequest:
-    body = await request.json()
+async def _resolve_json(
+    request: Request, model: type[SecurityCheckRequest]
+) -> ResolvedRequest:
+    # Parse and validate in one pass in pydantic-core; malformed JSON comes
+    # back as a ValidationError ("Invalid JSON: ...") like any other input error.
     try:
-        req = SecurityCheckRequest(**body)
+        req = model.model_validate_json(await request.body())
     except ValidationError as exc:
         details = "; ".join(
             f"{'.'.join(str(l) for l in e['loc'])}: {e['msg']}" if e.get("loc")
@@ -123,19 +163,77 @@ async def _resolve_json(request: Request) -> ResolvedRequest:
             detail=f"Request validation failed: {details}",
         ) from exc
     return ResolvedRequest(
-        b64_content=req.script_content,
+        content=req.script_bytes,
         script_format=req.script_format,
         project_id=req.project_id,
         metadata=req.metadata,
-        priority=body.get("priority", 5),
+        priority=getattr(req, "priority", 5),
         delivery=req.delivery,
         idempotency_key=req.idempotency_key,
         script_id=req.script_id,
     )
 
 
+def _upload_too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds maximum size of {max_size} bytes",
+    )
+
+
+def _capped_receive(receive: Receive, limit: int, max_size: int) -> Receive:
+    """Wrap *receive* so the request body fails with 413 past *limit* bytes."""
+    received = 0
+
+    async def capped() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > limit:
+                raise _upload_too_large(max_size)
+        return message
+
+    return capped
+
+
+async def _read_upload(upload: Any, max_size: int) -> bytes:
+    """Read the parsed *upload* into memory, rejecting it past *max_size*.
+
+    The request body is already capped while it is parsed (see
+    _resolve_multipart); this bounds the file part itself, from the
+    declared size when available, otherwise while reading it in chunks.
+    """
+    if (getattr(upload, "size", None) or 0) > max_size:
+        raise _upload_too_large(max_size)
+
+    chunks: list[bytes] = []
+    total = 0
+    while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_size:
+            raise _upload_too_large(max_size)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+# File extension or form value -> ScriptFormat (both are "fdx"/"pdf").  A
+# dict lookup instead of the enum constructor, whose ValueError on bad
+# input surfaced as a 500.
+_SCRIPT_FORMATS: dict[str, ScriptFormat] = {fmt.value: fmt for fmt in ScriptFormat}
+
+
 async def _resolve_multipart(request: Request) -> ResolvedRequest:
-    form = await request.form()
+    # Starlette spools the whole body before form() returns, so oversized
+    # bodies are refused up front from Content-Length and, for chunked
+    # uploads, as soon as the received bytes pass the limit.
+    max_size = _max_upload_size()
+    body_limit = max_size + _MULTIPART_OVERHEAD
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > body_limit:
+        raise _upload_too_large(max_size)
+    capped = Request(request.scope, _capped_receive(request.receive, body_limit, max_size))
+    form = await capped.form()
     upload = form.get("file")
     if upload is None or not hasattr(upload, "read"):
         raise HTTPException(
@@ -143,25 +241,17 @@ async def _resolve_multipart(request: Request) -> ResolvedRequest:
             detail="Multipart request must include a 'file' field",
         )
 
-    raw = await upload.read()
-    max_size = _max_upload_size()
-    if len(raw) > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File exceeds maximum size of {max_size} bytes",
-        )
+    raw = await _read_upload(upload, max_size)
     if not raw:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Uploaded file is empty",
         )
 
-    filename = (getattr(upload, "filename", "") or "").lower()
-    if filename.endswith(".fdx"):
-        fmt = ScriptFormat.FDX
-    elif filename.endswith(".pdf"):
-        fmt = ScriptFormat.PDF
-    else:
+    filename = getattr(upload, "filename", "") or ""
+    _, dot, extension = filename.rpartition(".")
+    fmt = _SCRIPT_FORMATS.get(extension.lower()) if dot else None
+    if fmt is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Unsupported file type. Allowed: .fdx, .pdf",
@@ -173,17 +263,21 @@ async def _resolve_multipart(request: Request) -> ResolvedRequest:
             detail="Uploaded file does not appear to be a valid PDF",
         )
 
-    b64 = base64.b64encode(raw).decode("ascii")
     project_id = str(form.get("project_id", ""))
     sf = str(form.get("script_format", ""))
     if sf:
-        fmt = ScriptFormat(sf)
+        fmt = _SCRIPT_FORMATS.get(sf.lower())
+        if fmt is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unsupported script_format. Allowed: fdx, pdf",
+            )
 
     raw_script_id = form.get("script_id")
     script_id = int(raw_script_id) if raw_script_id not in (None, "") else None
 
     return ResolvedRequest(
-        b64_content=b64,
+        content=raw,
         script_format=fmt,
         project_id=project_id,
         metadata={},
@@ -199,6 +293,47 @@ async def _resolve_multipart(request: Request) -> ResolvedRequest:
 # ---------------------------------------------------------------------------
 
 
+def _build_sync_stub_template() -> dict[str, Any]:
+    """Serialize the constant parts of the M01 stub response once.
+
+    Built from the response models, so the JSON shape (defaults included)
+    stays identical to what ``SyncSecurityCheckResponse`` would produce.
+    """
+    stub = SyncSecurityCheckResponse(
+        report=SecurityReport(
+            report_id=uuid.UUID(int=0),
+            project_id="",
+            script_format=ScriptFormat.FDX,
+            risk_summary={
+                RiskLevel.CRITICAL: 0,
+                RiskLevel.HIGH: 0,
+                RiskLevel.MEDIUM: 0,
+                RiskLevel.LOW: 0,
+                RiskLevel.INFO: 1,
+            },
+            total_findings=1,
+            findings=[
+                {
+                    "id": "",
+                    "scene_number": None,
+                    "risk_level": RiskLevel.INFO,
+                    "category": "stub",
+                    "description": "Stub response. Real analysis in later milestones.",
+                    "recommendation": "No action required for stub data.",
+                    "confidence": 1.0,
+                    "line_reference": None,
+                }
+            ],
+            processing_time_seconds=0.1,
+        ),
+        message="Security check completed successfully (M01 stub)",
+    )
+    return stub.model_dump(mode="json")
+
+
+_SYNC_STUB_TEMPLATE = _build_sync_stub_template()
+
+
 @router.post(
     "/check",
     response_model=SyncSecurityCheckResponse,
@@ -213,54 +348,34 @@ async def _resolve_multipart(request: Request) -> ResolvedRequest:
 async def security_check_sync(
     request: Request,
     actor_info: dict[str, str | None] = Depends(get_actor_headers),
-) -> SyncSecurityCheckResponse:
+) -> Response:
     """Synchronous security check endpoint.
 
     Accepts a script and returns a security analysis report immediately.
+    The stub body is the prebuilt ``_SYNC_STUB_TEMPLATE`` with only the
+    per-request fields replaced; ``response_model`` documents the shape.
     """
     resolved = await _resolve_request(request)
     fmt = resolved.script_format
     proj_id = resolved.project_id
 
-    report_id = uuid.uuid4()
-
-    mock_report = SecurityReport(
-        report_id=report_id,
-        project_id=proj_id or "unknown",
-        script_format=fmt,
-        created_at=datetime.utcnow(),
-        risk_summary={
-            RiskLevel.CRITICAL: 0,
-            RiskLevel.HIGH: 0,
-            RiskLevel.MEDIUM: 0,
-            RiskLevel.LOW: 0,
-            RiskLevel.INFO: 1,
+    template = _SYNC_STUB_TEMPLATE["report"]
+    return ORJSONResponse({
+        **_SYNC_STUB_TEMPLATE,
+        "report": {
+            **template,
+            "report_id": str(uuid.uuid4()),
+            "project_id": proj_id or "unknown",
+            "script_format": fmt.value,
+            "created_at": utcnow(),
+            "findings": [{**template["findings"][0], "id": str(uuid.uuid4())}],
+            "metadata": {
+                "user_id": actor_info.get("user_id"),
+                "project_id": actor_info.get("project_id"),
+                "stub": True,
+            },
         },
-        total_findings=1,
-        findings=[
-            {
-                "id": str(uuid.uuid4()),
-                "scene_number": None,
-                "risk_level": RiskLevel.INFO,
-                "category": "stub",
-                "description": "Stub response. Real analysis in later milestones.",
-                "recommendation": "No action required for stub data.",
-                "confidence": 1.0,
-                "line_reference": None,
-            }
-        ],
-        processing_time_seconds=0.1,
-        metadata={
-            "user_id": actor_info.get("user_id"),
-            "project_id": actor_info.get("project_id"),
-            "stub": True,
-        },
-    )
-
-    return SyncSecurityCheckResponse(
-        report=mock_report,
-        message="Security check completed successfully (M01 stub)",
-    )
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -268,6 +383,16 @@ async def security_check_sync(
 # ---------------------------------------------------------------------------
 
 
+async def _mark_job_failed(db: AsyncSession, job_id: uuid.UUID, message: str) -> None:
+    """Mark a job that could not be started as FAILED."""
+    await db.execute(
+        update(JobMetadata)
+        .where(JobMetadata.job_id == job_id)
+        .values(status=JobStatus.FAILED, error_message=message)
+    )
+    await db.commit()
+
+
 @router.post(
     "/check:async",
     response_model=AsyncSecurityCheckResponse,
@@ -295,30 +420,18 @@ async def security_check_async(
     settings = get_settings()
     buffer = _get_buffer(redis_client)
 
-    resolved = await _resolve_request(request)
-
-    # Idempotency check: if key exists, return existing job
-    if resolved.idempotency_key:
-        stmt = select(JobMetadata).where(
-            JobMetadata.idempotency_key == resolved.idempotency_key
-        )
-        existing = await db.execute(stmt)
-        existing_job = existing.scalar_one_or_none()
-        if existing_job:
-            return AsyncSecurityCheckResponse(
-                job_id=existing_job.job_id,
-                status=existing_job.status,
-                message="Existing job returned (idempotency key matched)",
-                status_url=f"/v1/security/jobs/{existing_job.job_id}",
-                estimated_completion_seconds=120,
-            )
+    resolved = await _resolve_request(request, AsyncSecurityCheckRequest)
 
     job_id = uuid.uuid4()
+    job_id_str = str(job_id)
     report_id = uuid.uuid4()
     delivery_mode = resolved.delivery or settings.delivery_mode
 
-    # Create JobMetadata in DB
-    job_meta = JobMetadata(
+    # Create JobMetadata in DB.  With an idempotency key this is an atomic
+    # get-or-create in one round trip: on conflict the no-op update makes
+    # RETURNING yield the existing row, so concurrent duplicates can't both
+    # start a workflow.
+    insert_stmt = pg_insert(JobMetadata).values(
         job_id=job_id,
         project_id=resolved.project_id or "unknown",
         script_format=resolved.script_format,
@@ -329,11 +442,58 @@ async def security_check_async(
         delivery_mode=delivery_mode,
         script_id=resolved.script_id,
     )
-    db.add(job_meta)
-    await db.commit()
+    if resolved.idempotency_key:
+        insert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[JobMetadata.idempotency_key],
+            set_={"idempotency_key": insert_stmt.excluded.idempotency_key},
+        )
+
+    async def _create_job() -> Row:
+        result = await db.execute(
+            insert_stmt.returning(JobMetadata.job_id, JobMetadata.status)
+        )
+        row = result.one()
+        await db.commit()
+        return row
 
-    # Store script content encrypted in Redis -- NOT in Temporal
-    ref_key = await buffer.store({"script_content": resolved.b64_content})
+    # Script content goes to Redis only -- NOT to Temporal -- as raw bytes
+    # (see SecureBuffer.store_bytes).
+    if resolved.idempotency_key:
+        # Claim the key before touching the payload, so a replay never
+        # encrypts or stores a copy it would have to throw away.
+        job_row = await _create_job()
+        if job_row.job_id != job_id:
+            return AsyncSecurityCheckResponse(
+                job_id=job_row.job_id,
+                status=job_row.status,
+                message="Existing job returned (idempotency key matched)",
+                status_url=f"/v1/security/jobs/{job_row.job_id}",
+                estimated_completion_seconds=120,
+            )
+        try:
+            ref_key = await buffer.store_bytes(resolved.content)
+        except Exception:
+            await _mark_job_failed(db, job_id, "Script could not be buffered.")
+            raise
+    else:
+        # Without an idempotency key the DB write and the encrypted Redis
+        # store are independent, so they run concurrently.
+        # return_exceptions: always let both finish before raising, so no
+        # task keeps using the request's DB session after the handler has
+        # failed.
+        job_row, ref_key = await asyncio.gather(
+            _create_job(),
+            buffer.store_bytes(resolved.content),
+            return_exceptions=True,
+        )
+        if isinstance(job_row, BaseException):
+            if not isinstance(ref_key, BaseException):
+                await buffer.delete(ref_key)
+            raise job_row
+        if isinstance(ref_key, BaseException):
+            # Don't leave a PENDING job behind that no worker can ever run.
+            await _mark_job_failed(db, job_id, "Script could not be buffered.")
+            raise ref_key
 
     # Temporal receives only metadata + ref_key.  Die M07-Konfiguration wird
     # beim Workflow-Start in job_data eingefroren, damit der Workflow rein
@@ -343,7 +503,7 @@ async def security_check_async(
         "ref_key": ref_key,
         "script_format": resolved.script_format.value,
         "project_id": resolved.project_id or "unknown",
-        "job_id": str(job_id),
+        "job_id": job_id_str,
         "report_id": str(report_id),
         "user_id": actor_info.get("user_id"),
         "priority": resolved.priority,
@@ -360,33 +520,25 @@ async def security_check_async(
         await temporal_client.start_workflow(
             SecurityCheckWorkflow.run,
             job_data,
-            id=str(job_id),
+            id=job_id_str,
             task_queue=settings.temporal_task_queue,
             execution_timeout=timedelta(seconds=settings.temporal_workflow_execution_timeout),
         )
     except ServiceUnavailableException:
         raise
     except Exception as exc:
-        logger.error(f"Failed to start workflow for job {job_id}: {exc}", exc_info=True)
-        await db.execute(
-            update(JobMetadata)
-            .where(JobMetadata.job_id == job_id)
-            .values(
-                status=JobStatus.FAILED,
-                error_message="Workflow engine temporarily unavailable.",
-            )
-        )
-        await db.commit()
+        logger.error(f"Failed to start workflow for job {job_id_str}: {exc}", exc_info=True)
+        await _mark_job_failed(db, job_id, "Workflow engine temporarily unavailable.")
         raise ServiceUnavailableException(
             "Security check could not be started. The workflow engine is temporarily unavailable.",
-            details={"job_id": str(job_id)},
+            details={"job_id": job_id_str},
         ) from exc
 
     return AsyncSecurityCheckResponse(
         job_id=job_id,
         status=JobStatus.PENDING,
         message=f"Security check job started (delivery={delivery_mode})",
-        status_url=f"/v1/security/jobs/{job_id}",
+        status_url=f"/v1/security/jobs/{job_id_str}",
         estimated_completion_seconds=120,
     )
 
@@ -406,7 +558,7 @@ async def security_check_async(
 )
 async def get_job_status(
     job_id: uuid.UUID = Path(..., description="Job ID to query"),
-    api_key: ApiKeyModel = Depends(verify_api_key),
+    api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
 ) -> JobStatusResponse:
     """Get real job status from database with ownership verification."""
@@ -435,6 +587,96 @@ async def get_job_status(
     )
 
 
+# (claimed, report_ref_key, retrieved_at); claimed is None for "not found".
+_ReportClaim = tuple[bool | None, str | None, datetime | None]
+
+
+def _claim_report_stmt(
+    report_id: uuid.UUID, user_id: str
+) -> "Select[uuid.UUID | None, str | None, datetime | None]":
+    """Build the one-shot claim as a single statement (PostgreSQL).
+
+    The data-modifying CTE ``upd`` marks the report retrieved; ``cur`` sees
+    the pre-update snapshot, so one row comes back iff the report exists for
+    this user, and ``upd.report_id`` is set iff this call claimed it.
+    ``retrieved_at`` is set by the database (``now()``) and returned.
+    """
+    upd = (
+        update(ReportMetadata)
+        .where(
+            ReportMetadata.report_id == report_id,
+            ReportMetadata.user_id == user_id,
+            ReportMetadata.is_retrieved.is_(False),
+        )
+        .values(is_retrieved=True, retrieved_at=func.now())
+        .returning(
+            ReportMetadata.report_id,
+            ReportMetadata.report_ref_key,
+            ReportMetadata.retrieved_at,
+        )
+        .cte("upd")
+    )
+    cur = (
+        select(ReportMetadata.report_id)
+        .where(
+            ReportMetadata.report_id == report_id,
+            ReportMetadata.user_id == user_id,
+        )
+        .cte("cur")
+    )
+    return select(upd.c.report_id, upd.c.report_ref_key, upd.c.retrieved_at).select_from(
+        cur.outerjoin(upd, true())
+    )
+
+
+async def _claim_report_single_query(
+    db: AsyncSession, report_id: uuid.UUID, user_id: str
+) -> _ReportClaim:
+    """Claim a report in one round trip.
+
+    Returns ``(None, None, None)`` if the report doesn't exist for this user,
+    ``(False, None, None)`` if it was already retrieved, else
+    ``(True, ref_key, retrieved_at)``.
+    """
+    result = await db.execute(_claim_report_stmt(report_id, user_id))
+    row = result.first()
+    if row is None:
+        return None, None, None
+    claimed_id, report_ref_key, retrieved_at = row
+    return claimed_id is not None, report_ref_key, retrieved_at
+
+
+async def _claim_report(
+    db: AsyncSession, report_id: uuid.UUID, user_id: str
+) -> _ReportClaim:
+    """Portable variant of ``_claim_report_single_query`` for databases
+    without data-modifying CTEs (SQLite in tests): UPDATE, then a SELECT
+    to tell 404 from 410 only when the update matched nothing."""
+    result = await db.execute(
+        update(ReportMetadata)
+        .where(
+            ReportMetadata.report_id == report_id,
+            ReportMetadata.user_id == user_id,
+            ReportMetadata.is_retrieved.is_(False),
+        )
+        .values(is_retrieved=True, retrieved_at=func.now())
+        .returning(ReportMetadata.report_ref_key, ReportMetadata.retrieved_at)
+    )
+    row = result.first()
+    if row is not None:
+        return True, row[0], row[1]
+
+    state_result = await db.execute(
+        select(ReportMetadata.is_retrieved).where(
+            ReportMetadata.report_id == report_id,
+            ReportMetadata.user_id == user_id,
+        )
+    )
+    if state_result.scalar_one_or_none() is None:
+        return None, None, None
+    return False, None, None
+
+
 @router.get(
     "/reports/{report_id}",
     response_model=ReportResponse,
@@ -445,7 +687,7 @@ async def get_job_status(
 )
 async def get_report(
     report_id: uuid.UUID = Path(..., description="Report ID to retrieve"),
-    api_key: ApiKeyModel = Depends(verify_api_key),
+    api_key: AuthenticatedKey = Depends(verify_api_key),
     db: AsyncSession = Depends(get_db),
     redis_client: aioredis.Redis = Depends(get_redis),
 ) -> ReportResponse:
@@ -453,54 +695,38 @@ async def get_report(
 
     After the first successful 2xx response, the report URL is invalidated.
     """
-    # Atomically enforce one-shot retrieval
-    retrieved_at = datetime.utcnow()
-    update_stmt = (
-        update(ReportMetadata)
-        .where(
-            ReportMetadata.report_id == report_id,
-            ReportMetadata.user_id == api_key.user_id,
-            ReportMetadata.is_retrieved.is_(False),
+    # Atomically enforce one-shot retrieval; the database stamps retrieved_at.
+    if db.get_bind().dialect.name == "postgresql":
+        claimed, report_ref_key, retrieved_at = await _claim_report_single_query(
+            db, report_id, api_key.user_id
         )
-        .values(is_retrieved=True, retrieved_at=retrieved_at)
-        .returning(ReportMetadata.report_ref_key)
-    )
-    update_result = await db.execute(update_stmt)
-    row = update_result.first()
-
-    if not row:
-        # Check why it failed
-        state_stmt = select(ReportMetadata.is_retrieved).where(
-            ReportMetadata.report_id == report_id,
-            ReportMetadata.user_id == api_key.user_id,
+    else:
+        claimed, report_ref_key, retrieved_at = await _claim_report(
+            db, report_id, api_key.user_id
         )
-        state_result = await db.execute(state_stmt)
-        is_retrieved = state_result.scalar_one_or_none()
 
-        if is_retrieved is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Report not found or access denied",
-            )
+    if claimed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found or access denied",
+        )
+    if not claimed:
         raise HTTPException(
             status_code=status.HTTP_410_GONE,
             detail="Report already retrieved. URL is no longer valid.",
         )
 
     await db.commit()
-    report_ref_key = row[0]
 
     # Fetch report from Redis SecureBuffer
     buffer = _get_buffer(redis_client)
     pdf_base64 = None
 
     try:
-        report_package = await buffer.retrieve(report_ref_key)
+        # Fetch and delete in one atomic step (One-Shot)
+        report_package = await buffer.retrieve_and_delete(report_ref_key)
         report_data = report_package.get("report", report_package)
         pdf_base64 = report_package.get("pdf_base64")
-
-        # Delete from Redis after successful retrieval (One-Shot)
-        await buffer.delete(report_ref_key)
     except Exception:
         # Report expired from Redis (TTL), return what we can from metadata
         report_data = {
@@ -0,0 +1,18 @@
+"""Types describing an authenticated API caller."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedKey:
+    """API key identity resolved by ``verify_api_key``.
+
+    Not bound to a database session, so instances can be cached and shared
+    across requests.  ``expires_at`` is in epoch seconds.
+    """
+
+    id: UUID
+    user_id: str
+    organization_id: str | None
+    expires_at: float
@@ -1,15 +1,56 @@
 """Pydantic models for API request/response schemas."""
 
-import base64
+import binascii
 import ipaddress
 import re
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
-from urllib.parse import urlparse
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, model_validator
+import pybase64
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+# Identifier formats checked by the request validators.  ``\Z`` rather than
+# ``$`` so a trailing newline doesn't slip through.
+_PROJECT_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{1,100}\Z")
+_METADATA_KEY_RE = re.compile(r"^[a-zA-Z0-9_-]{1,50}\Z")
+
+# Non-string metadata value types.  A tuple, so isinstance doesn't build an
+# ``int | float | bool`` union object on every call.
+_METADATA_SCALAR_TYPES = (int, float, bool)
+
+# Hosts that may receive callback deliveries (SSRF whitelist).
+_ALLOWED_CALLBACK_DOMAINS = frozenset({
+    "epro.filmakademie.de",
+    "staging.epro.filmakademie.de",
+})
+_ALLOWED_CALLBACK_DOMAINS_MSG = ", ".join(sorted(_ALLOWED_CALLBACK_DOMAINS))
+# HttpUrl hosts arrive lowercased but keep a trailing dot (FQDN form), so
+# both spellings are accepted without normalizing each request's host.
+_ALLOWED_CALLBACK_HOSTS = _ALLOWED_CALLBACK_DOMAINS | {f"{d}." for d in _ALLOWED_CALLBACK_DOMAINS}
+
+# Base64 characters holding the first 1026 decoded bytes -- enough for the
+# script format probes.  A multiple of 4, so any prefix this long decodes.
+_B64_PROBE_CHARS = 1368
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form the API has always emitted.
+
+    Replaces the deprecated ``datetime.utcnow`` for API timestamps (model
+    default factories, error bodies, stub reports) without changing the
+    serialized timestamp format.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
 
 
 class JobStatus(str, Enum):
@@ -145,7 +186,8 @@ class SecurityCheckRequest(BaseModel):
         description="eProjekt project ID",
         min_length=1,
         max_length=100,
-        pattern=r"^[a-zA-Z0-9_-]+$",
+        # Enforced once by validate_project_id; only documented here.
+        json_schema_extra={"pattern": r"^[a-zA-Z0-9_-]+$"},
     )
     script_id: int | None = Field(
         None,
@@ -169,6 +211,15 @@ class SecurityCheckRequest(BaseModel):
         default_factory=dict, description="Additional metadata for audit trail"
     )
 
+    # Decoded script_content, kept by the validator so callers don't decode
+    # the (up to 10 MB) base64 payload a second time.
+    _script_bytes: bytes = PrivateAttr(default=b"")
+
+    @property
+    def script_bytes(self) -> bytes:
+        """Raw script bytes decoded from ``script_content``."""
+        return self._script_bytes
+
     @model_validator(mode="after")
     def validate_script_content(self) -> "SecurityCheckRequest":
         """Validate base64 encoding, size, and content type based on format."""
@@ -179,29 +230,42 @@ class SecurityCheckRequest(BaseModel):
             raise ValueError("Script content cannot be empty")
 
         try:
-            decoded = base64.b64decode(v, validate=True)
-        except base64.binascii.Error:
+            # pybase64: SIMD decoder, same API and errors as the stdlib one.
+            # The format checks below only look at the first 1000 bytes, so
+            # decode just that much first: payloads of the wrong type are
+            # rejected without decoding megabytes.
+            head = pybase64.b64decode(v[:_B64_PROBE_CHARS], validate=True)
+        except binascii.Error:
             raise ValueError("Invalid base64 encoding")
 
-        # Check decoded size (10MB limit)
-        max_size = 10 * 1024 * 1024
-        if len(decoded) > max_size:
-            raise ValueError(f"Decoded script exceeds {max_size} byte limit")
-
         # Format-specific validation
         if fmt == ScriptFormat.FDX:
             # FDX is XML text -- validate no null bytes and valid UTF-8
-            if b"\x00" in decoded[:1000]:
+            if b"\x00" in head[:1000]:
                 raise ValueError("FDX script contains invalid null bytes")
             try:
-                decoded[:1000].decode("utf-8")
+                head[:1000].decode("utf-8")
             except UnicodeDecodeError:
                 raise ValueError("FDX script does not appear to be valid text")
         elif fmt == ScriptFormat.PDF:
             # PDF is binary -- just check it starts with %PDF
-            if not decoded[:5].startswith(b"%PDF"):
+            if not head[:5].startswith(b"%PDF"):
                 raise ValueError("File does not appear to be a valid PDF")
 
+        if len(v) <= _B64_PROBE_CHARS:
+            decoded = head
+        else:
+            try:
+                decoded = pybase64.b64decode(v, validate=True)
+            except binascii.Error:
+                raise ValueError("Invalid base64 encoding")
+
+        # Check decoded size (10MB limit)
+        max_size = 10 * 1024 * 1024
+        if len(decoded) > max_size:
+            raise ValueError(f"Decoded script exceeds {max_size} byte limit")
+
+        self._script_bytes = decoded
         return self
 
     @field_validator("callback_url")
@@ -211,37 +275,35 @@ class SecurityCheckRequest(BaseModel):
         if v is None:
             return v
 
-        parsed = urlparse(str(v))
-
         # Enforce TLS for callback delivery.
-        if parsed.scheme != "https":
+        if v.scheme != "https":
             raise ValueError("Callback URL must use HTTPS")
 
-        # Block private/internal IP ranges
-        hostname = parsed.hostname
+        # Block private/internal IP ranges.  HttpUrl has already parsed the
+        # host (lowercased, punycode for IDNs); IPv6 literals keep brackets.
+        hostname = v.host
         if not hostname:
             raise ValueError("Invalid callback URL hostname")
 
-        try:
-            ip = ipaddress.ip_address(hostname)
-        except ValueError:
-            ip = None
-
-        if ip and (
-            ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast or ip.is_reserved
-        ):
+        # Only hosts that can be IP literals (IPv4 starts with a digit, IPv6
+        # is bracketed) are parsed; domain names skip the raise/catch.
+        ip = None
+        if hostname[0].isdigit() or hostname[0] == "[":
+            try:
+                ip = ipaddress.ip_address(hostname.strip("[]"))
+            except ValueError:
+                pass
+
+        # is_global excludes private, loopback, link-local, reserved and
+        # shared (CGNAT) ranges in one lookup; multicast still counts as
+        # global, hence the second check.
+        if ip is not None and (not ip.is_global or ip.is_multicast):
             raise ValueError("Callback URL cannot point to private/internal IP addresses")
 
-        # Whitelist of allowed domains
-        allowed_domains = {
-            "epro.filmakademie.de",
-            "staging.epro.filmakademie.de",
-        }
-
-        if hostname.lower().rstrip(".") not in allowed_domains:
+        if hostname not in _ALLOWED_CALLBACK_HOSTS:
             raise ValueError(
                 "Callback URL domain not allowed. "
-                f"Allowed: {', '.join(sorted(allowed_domains))}"
+                f"Allowed: {_ALLOWED_CALLBACK_DOMAINS_MSG}"
             )
 
         return v
@@ -253,7 +315,7 @@ class SecurityCheckRequest(BaseModel):
         if not v.strip():
             raise ValueError("project_id cannot be empty")
 
-        if not re.match(r"^[a-zA-Z0-9_-]{1,100}$", v):
+        if not _PROJECT_ID_RE.match(v):
             raise ValueError(
                 "project_id must contain only alphanumeric characters, "
                 "hyphens, and underscores (max 100 chars)"
@@ -270,7 +332,7 @@ class SecurityCheckRequest(BaseModel):
 
         for key, value in v.items():
             # Validate key format
-            if not re.match(r"^[a-zA-Z0-9_-]{1,50}$", key):
+            if not _METADATA_KEY_RE.match(key):
                 raise ValueError(f"Invalid metadata key format: {key}")
 
             # Validate value type and size
@@ -280,7 +342,7 @@ class SecurityCheckRequest(BaseModel):
                         raise ValueError(
                             f"Metadata value too long for key '{key}' (max 1000 chars)"
                         )
-                elif not isinstance(value, int | float | bool):
+                elif not isinstance(value, _METADATA_SCALAR_TYPES):
                     raise ValueError(
                         f"Invalid metadata value type for key '{key}'. "
                         "Allowed: string, number, boolean, null"
@@ -301,18 +363,20 @@ class AsyncSecurityCheckRequest(SecurityCheckRequest):
 class HealthResponse(BaseModel):
     """Health check response."""
 
-    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     status: str = Field(default="healthy", description="Service health status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=utcnow, description="Response timestamp")
     version: str = Field(default="0.1.0", description="API version")
 
 
 class ReadinessResponse(BaseModel):
     """Readiness check response with dependency status."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str = Field(..., description="Overall readiness status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=utcnow, description="Response timestamp")
     services: dict[str, bool] = Field(..., description="Service availability status")
 
 
@@ -328,6 +392,8 @@ class MeasureItem(BaseModel):
 class RiskFinding(BaseModel):
     """Individual risk finding in a script (M04: extended with taxonomy and scoring)."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     id: str = Field(..., description="Unique finding ID")
     scene_number: str | None = Field(None, description="Scene number where risk was found")
     risk_level: RiskLevel = Field(..., description="Severity level (calculated from likelihood x impact)")
@@ -370,11 +436,13 @@ class RiskFinding(BaseModel):
 class SecurityReport(BaseModel):
     """Security analysis report."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     report_id: UUID = Field(..., description="Unique report ID")
     project_id: str = Field(..., description="eProjekt project ID")
     script_format: ScriptFormat = Field(..., description="Format of analyzed script")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Report creation timestamp"
+        default_factory=utcnow, description="Report creation timestamp"
     )
     risk_summary: dict[RiskLevel, int] = Field(..., description="Count of findings per risk level")
     total_findings: int = Field(..., description="Total number of findings")
@@ -396,6 +464,8 @@ class SyncSecurityCheckResponse(BaseModel):
 class AsyncSecurityCheckResponse(BaseModel):
     """Response for asynchronous security check."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", use_enum_values=True)
+
     job_id: UUID = Field(..., description="Unique job ID for tracking")
     status: JobStatus = Field(default=JobStatus.PENDING, description="Initial job status")
     message: str = Field(
@@ -411,6 +481,8 @@ class AsyncSecurityCheckResponse(BaseModel):
 class JobStatusResponse(BaseModel):
     """Response for job status query."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", use_enum_values=True)
+
     job_id: UUID = Field(..., description="Job ID")
     status: JobStatus = Field(..., description="Current job status")
     created_at: datetime = Field(..., description="Job creation timestamp")
@@ -450,8 +522,10 @@ class ErrorDetail(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Human-readable error message")
     details: list[ErrorDetail] = Field(default_factory=list, description="Detailed error info")
     request_id: str | None = Field(None, description="Request tracking ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=utcnow, description="Error timestamp")
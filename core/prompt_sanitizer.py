@@ -6,6 +6,8 @@ from re import Pattern
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class PromptSanitizer:
     """Sanitize and validate prompts to prevent injection attacks."""
@@ -84,10 +86,12 @@ class PromptSanitizer:
         prompt = prompt.replace("\x00", "")
 
         # Remove excessive whitespace
-        prompt = re.sub(r"\s+", " ", prompt)
+        prompt = _WHITESPACE_RE.sub(" ", prompt)
 
-        # Remove control characters except newlines and tabs
-        prompt = "".join(char for char in prompt if char.isprintable() or char in "\n\t")
+        # Remove control characters except newlines and tabs.  The C-level
+        # isprintable() lets ordinary prompts skip the per-character filter.
+        if not prompt.isprintable():
+            prompt = "".join(char for char in prompt if char.isprintable() or char in "\n\t")
 
         return prompt.strip()
 
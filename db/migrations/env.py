@@ -20,7 +20,7 @@ if config.config_file_name is not None:
 # Set SQLAlchemy URL from settings
 # Escape '%' as '%%' because configparser treats '%' as interpolation syntax
 settings = get_settings()
-db_url = str(settings.database_url).replace("+asyncpg", "").replace("%", "%%")
+db_url = settings.database_url_s.replace("+asyncpg", "").replace("%", "%%")
 config.set_main_option("sqlalchemy.url", db_url)
 
 # add your model's MetaData object here
@@ -8,11 +8,21 @@ from api.config import get_settings
 
 # Create async engine
 settings = get_settings()
+if not settings.database_url_s.startswith("postgresql+asyncpg://"):
+    raise RuntimeError("DATABASE_URL must use the postgresql+asyncpg:// driver")
+
+# No pre-ping: it costs a round-trip on every checkout.  Connections are
+# recycled before server/proxy idle timeouts instead; after a database
+# restart the first failing checkout invalidates the whole pool.  JIT is
+# off because the API only runs short indexed queries, where JIT
+# compilation is pure overhead.
 engine = create_async_engine(
-    str(settings.database_url),
+    settings.database_url_s,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
+    pool_pre_ping=False,
+    pool_recycle=settings.database_pool_recycle,
+    connect_args={"server_settings": {"jit": "off"}},
     echo=settings.debug,
 )
 
@@ -30,7 +40,7 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
     """
     Get database session.
 
-    Yields an async database session and ensures it's properly closed.
+    Yields an async database session; ``async with`` closes it.
     """
     async with AsyncSessionFactory() as session:
         try:
@@ -39,5 +49,3 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
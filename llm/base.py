@@ -1,12 +1,18 @@
 """Base class for LLM providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
+import httpx
+
 
 class BaseLLMProvider(ABC):
     """Base class for all LLM providers."""
 
+    # Default request timeout (seconds) for the pooled HTTP client.
+    timeout: float = 120
+
     def __init__(self, config: dict[str, Any]) -> None:
         """
         Initialize LLM provider.
@@ -15,6 +21,27 @@ class BaseLLMProvider(ABC):
             config: Provider-specific configuration
         """
         self.config = config
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the provider's pooled HTTP client, created on first use.
+
+        Keeps connections (and TLS sessions) alive across calls.  The pool
+        is bound to the event loop it was opened on, so a call from another
+        loop (``asyncio.run`` in scripts, per-test loops) gets a new client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (process shutdown)."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
 
     @abstractmethod
     async def generate(
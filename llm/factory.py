@@ -1,6 +1,7 @@
 """Factory for creating LLM providers."""
 
 import logging
+from typing import Any
 
 from api.config import Settings
 from llm.base import BaseLLMProvider
@@ -11,9 +12,26 @@ from llm.ollama import OllamaProvider
 logger = logging.getLogger(__name__)
 
 
+# Providers keep no per-request state, so one instance per distinct
+# configuration is reused for the life of the process -- together with its
+# pooled HTTP client (see BaseLLMProvider._http_client).  close_llm_providers
+# releases them on shutdown.
+_providers: dict[tuple[str, tuple[tuple[str, Any], ...]], BaseLLMProvider] = {}
+
+_PROVIDER_CLASSES: dict[str, type[BaseLLMProvider]] = {
+    "mistral_cloud": MistralCloudProvider,
+    "local_mistral": LocalMistralProvider,
+    "ollama": OllamaProvider,
+}
+
+
 def get_llm_provider(settings: Settings) -> BaseLLMProvider:
     """
-    Create LLM provider based on settings.
+    Get the LLM provider configured by settings.
+
+    Instances are cached per provider type and configuration, so repeated
+    calls (one per activity or request) return the same provider and reuse
+    its HTTP connections.
 
     Args:
         settings: Application settings
@@ -26,15 +44,12 @@ def get_llm_provider(settings: Settings) -> BaseLLMProvider:
     """
     provider_type = settings.llm_provider.lower()
 
-    logger.info(f"Initializing LLM provider: {provider_type}")
-
     if provider_type == "mistral_cloud":
         config = {
             "api_key": settings.mistral_api_key,
             "model": settings.mistral_model,
             "timeout": settings.mistral_timeout,
         }
-        return MistralCloudProvider(config)
 
     elif provider_type == "local_mistral":
         config = {
@@ -44,7 +59,6 @@ def get_llm_provider(settings: Settings) -> BaseLLMProvider:
             "think": settings.ollama_think,
             "num_ctx": settings.ollama_num_ctx,
         }
-        return LocalMistralProvider(config)
 
     elif provider_type == "ollama":
         config = {
@@ -56,7 +70,6 @@ def get_llm_provider(settings: Settings) -> BaseLLMProvider:
             "embedding_model": settings.ollama_embedding_model,
             "embedding_max_chars": settings.ollama_embedding_max_chars,
         }
-        return OllamaProvider(config)
 
     else:
         raise ValueError(
@@ -64,6 +77,24 @@ def get_llm_provider(settings: Settings) -> BaseLLMProvider:
             f"Valid options: mistral_cloud, local_mistral, ollama"
         )
 
+    key = (provider_type, tuple(sorted(config.items())))
+    provider = _providers.get(key)
+    if provider is None:
+        logger.info(f"Initializing LLM provider: {provider_type}")
+        provider = _providers[key] = _PROVIDER_CLASSES[provider_type](config)
+    return provider
+
+
+async def close_llm_providers() -> None:
+    """Close the HTTP clients of all cached providers and drop the cache."""
+    providers = list(_providers.values())
+    _providers.clear()
+    for provider in providers:
+        try:
+            await provider.aclose()
+        except Exception:
+            logger.warning(f"Failed to close LLM provider {provider.provider_name}", exc_info=True)
+
 
 async def test_llm_provider(provider: BaseLLMProvider) -> bool:
     """
@@ -79,18 +79,18 @@ class MistralCloudProvider(BaseLLMProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result["choices"][0]["message"]["content"]
+            client = self._http_client()
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+            response.raise_for_status()
+            result = response.json()
+            return result["choices"][0]["message"]["content"]
 
         except httpx.HTTPError as e:
             logger.error(f"Mistral Cloud API error: {e}")
@@ -215,17 +215,17 @@ class MistralCloudProvider(BaseLLMProvider):
                 payload[k] = v
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-                result = response.json()
+            client = self._http_client()
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+            response.raise_for_status()
+            result = response.json()
         except httpx.HTTPError as e:
             logger.error(f"Mistral Cloud structured API error: {e}")
             raise LLMException(
@@ -269,12 +269,13 @@ class MistralCloudProvider(BaseLLMProvider):
     async def health_check(self) -> bool:
         """Check Mistral Cloud API availability."""
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                )
-                return response.status_code == 200
+            client = self._http_client()
+            response = await client.get(
+                f"{self.base_url}/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=10,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Mistral Cloud health check failed: {e}")
             return False
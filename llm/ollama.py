@@ -25,10 +25,11 @@ _THINKING_TAG_PATTERN = re.compile(r"<think>.*?</think>\s*", re.DOTALL | re.IGNO
 # =====================================================================
 # M07 – Prozessweite Ollama-Drosselung
 #
-# OllamaProvider wird im aktuellen Code für jede Activity neu instanziiert
-# (siehe llm/factory.py: get_llm_provider). Damit ein Concurrency-Cap über
-# Activities und parallele Workflows hinweg überhaupt greifen kann, MUSS
-# der Semaphore modul-global sein. Lazy-Initialisierung wird benötigt, weil
+# get_llm_provider (llm/factory.py) cached OllamaProvider-Instanzen nur
+# pro Konfiguration; direkt erzeugte Instanzen (Tests, Skripte) teilen
+# sich nichts. Damit ein Concurrency-Cap über Activities und parallele
+# Workflows hinweg zuverlässig greift, MUSS der Semaphore modul-global
+# sein. Lazy-Initialisierung wird benötigt, weil
 # asyncio.Semaphore() im Modul-Top-Level zur Import-Zeit den dann noch
 # nicht laufenden Event-Loop binden würde.
 #
@@ -201,14 +202,14 @@ class OllamaProvider(BaseLLMProvider):
 
         try:
             async with _ollama_slot():
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/api/generate",
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    return result["response"]
+                client = self._http_client()
+                response = await client.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                )
+                response.raise_for_status()
+                result = response.json()
+                return result["response"]
 
         except httpx.HTTPError as e:
             logger.error(f"Ollama API error: {e}")
@@ -251,14 +252,14 @@ class OllamaProvider(BaseLLMProvider):
 
         try:
             async with _ollama_slot():
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/api/chat",
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    return result["message"]["content"]
+                client = self._http_client()
+                response = await client.post(
+                    f"{self.base_url}/api/chat",
+                    json=payload,
+                )
+                response.raise_for_status()
+                result = response.json()
+                return result["message"]["content"]
 
         except httpx.HTTPError as e:
             logger.error(f"Ollama Chat API error: {e}")
@@ -320,13 +321,13 @@ class OllamaProvider(BaseLLMProvider):
 
         try:
             async with _ollama_slot():
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/api/chat",
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    result = response.json()
+                client = self._http_client()
+                response = await client.post(
+                    f"{self.base_url}/api/chat",
+                    json=payload,
+                )
+                response.raise_for_status()
+                result = response.json()
         except httpx.HTTPError as e:
             logger.error(f"Ollama Chat API error: {e}")
             raise LLMException(
@@ -401,13 +402,13 @@ class OllamaProvider(BaseLLMProvider):
         payload = {"model": self.embedding_model, "prompt": clean_text}
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/embeddings",
-                    json=payload,
-                )
-                response.raise_for_status()
-                result = response.json()
+            client = self._http_client()
+            response = await client.post(
+                f"{self.base_url}/api/embeddings",
+                json=payload,
+            )
+            response.raise_for_status()
+            result = response.json()
         except httpx.HTTPError as e:
             logger.error(f"Ollama embeddings API error: {e}")
             raise LLMException(
@@ -426,9 +427,9 @@ class OllamaProvider(BaseLLMProvider):
     async def health_check(self) -> bool:
         """Check Ollama availability."""
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            client = self._http_client()
+            response = await client.get(f"{self.base_url}/api/tags", timeout=10)
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
             return False
@@ -441,11 +442,11 @@ class OllamaProvider(BaseLLMProvider):
             List of model names
         """
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                result = response.json()
-                return [model["name"] for model in result.get("models", [])]
+            client = self._http_client()
+            response = await client.get(f"{self.base_url}/api/tags", timeout=10)
+            response.raise_for_status()
+            result = response.json()
+            return [model["name"] for model in result.get("models", [])]
         except Exception as e:
             logger.error(f"Failed to list Ollama models: {e}")
             return []
@@ -461,13 +462,14 @@ class OllamaProvider(BaseLLMProvider):
             True if successful
         """
         try:
-            async with httpx.AsyncClient(timeout=600) as client:  # 10 min timeout
-                response = await client.post(
-                    f"{self.base_url}/api/pull",
-                    json={"name": model, "stream": False},
-                )
-                response.raise_for_status()
-                return True
+            client = self._http_client()
+            response = await client.post(
+                f"{self.base_url}/api/pull",
+                json={"name": model, "stream": False},
+                timeout=600,  # 10 min timeout
+            )
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f"Failed to pull Ollama model {model}: {e}")
             return False
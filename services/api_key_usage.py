@@ -0,0 +1,204 @@
+"""Batched API key usage tracking.
+
+``verify_api_key`` only bumps an in-process counter per request -- no I/O.
+A background task started in the FastAPI lifespan pushes those counts to
+Redis every ``USAGE_PUSH_INTERVAL_SECONDS`` (one pipelined round trip for
+all keys, shared across worker processes), and every
+``USAGE_FLUSH_INTERVAL_SECONDS`` drains Redis into
+``api_keys.usage_count`` / ``last_used_at`` with a single bulk UPDATE, so
+the authentication hot path never opens a write transaction.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from sqlalchemy import DateTime, Integer, column, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.db_models import ApiKeyModel
+
+logger = logging.getLogger(__name__)
+
+USAGE_KEY_PREFIX = "apikey:usage:"
+LAST_USED_KEY_PREFIX = "apikey:last_used:"
+USAGE_FLUSH_INTERVAL_SECONDS = 30
+USAGE_PUSH_INTERVAL_SECONDS = 1.0
+
+# key_id -> (uses since the last push, latest use in epoch seconds).
+_pending: dict[UUID, tuple[int, float]] = {}
+
+
+def record_usage(key_id: UUID, used_at: float | None = None) -> None:
+    """Count one use of *key_id* in process memory.
+
+    *used_at* is the request time in epoch seconds (defaults to now); it is
+    stored as-is and only converted to a datetime when flushed.  Runs on the
+    event loop without awaiting, so no lock is needed.
+    """
+    count, _ = _pending.get(key_id, (0, 0.0))
+    _pending[key_id] = (count + 1, used_at if used_at is not None else time.time())
+
+
+async def push_usage(redis_client: aioredis.Redis) -> int:
+    """Move the in-process counts to Redis in one pipelined round trip.
+
+    Usage tracking is monitoring-only: Redis errors are logged, the counts
+    are kept for the next push, and nothing is raised.
+
+    Returns:
+        Number of API keys pushed.
+    """
+    global _pending
+    if not _pending:
+        return 0
+    pending, _pending = _pending, {}
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for key_id, (count, last_used) in pending.items():
+            pipe.incrby(f"{USAGE_KEY_PREFIX}{key_id}", count)
+            pipe.set(f"{LAST_USED_KEY_PREFIX}{key_id}", last_used)
+        await pipe.execute()
+    except Exception:
+        logger.warning("Redis unavailable for API key usage tracking", exc_info=True)
+        for key_id, (count, last_used) in pending.items():
+            newer_count, newer_used = _pending.get(key_id, (0, 0.0))
+            _pending[key_id] = (count + newer_count, max(last_used, newer_used))
+        return 0
+
+    return len(pending)
+
+
+async def flush_usage(redis_client: aioredis.Redis, session: AsyncSession) -> int:
+    """Move accumulated usage counters from Redis into Postgres.
+
+    Counters are read-and-cleared atomically with ``GETDEL`` so concurrent
+    flushers in other worker processes never double count.  If the database
+    write fails, the drained counts and ``last_used`` values are put back
+    into Redis.
+
+    Returns:
+        Number of API keys updated.
+    """
+    usage_keys = [
+        key async for key in redis_client.scan_iter(match=f"{USAGE_KEY_PREFIX}*", count=500)
+    ]
+    if not usage_keys:
+        return 0
+
+    key_ids = [_key_id(key) for key in usage_keys]
+    pipe = redis_client.pipeline(transaction=False)
+    for key_id in key_ids:
+        pipe.getdel(f"{USAGE_KEY_PREFIX}{key_id}")
+        pipe.getdel(f"{LAST_USED_KEY_PREFIX}{key_id}")
+    drained = await pipe.execute()
+
+    now = datetime.now(UTC)
+    rows: list[tuple[UUID, int, datetime]] = []
+    for index, key_id in enumerate(key_ids):
+        delta, last_used = drained[2 * index], drained[2 * index + 1]
+        if not delta:
+            continue
+        rows.append(
+            (
+                UUID(key_id),
+                int(delta),
+                datetime.fromtimestamp(float(last_used), UTC) if last_used else now,
+            )
+        )
+    if not rows:
+        return 0
+
+    usage = values(
+        column("id", PGUUID(as_uuid=True)),
+        column("delta", Integer),
+        column("last_used_at", DateTime(timezone=True)),
+        name="usage",
+    ).data(rows)
+    stmt = (
+        update(ApiKeyModel)
+        .where(ApiKeyModel.id == usage.c.id)
+        .values(
+            usage_count=ApiKeyModel.usage_count + usage.c.delta,
+            last_used_at=usage.c.last_used_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    try:
+        await session.execute(stmt)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        await _restore_usage(redis_client, rows)
+        raise
+
+    return len(rows)
+
+
+async def _restore_usage(
+    redis_client: aioredis.Redis, rows: list[tuple[UUID, int, datetime]]
+) -> None:
+    """Put drained counters back into Redis after a failed database write.
+
+    Counts are added to whatever accumulated since the drain.  ``last_used``
+    is only set if absent: a value pushed after the drain is newer.  If
+    Redis fails too, the lost deltas are logged so they can be reconciled.
+    """
+    try:
+        restore = redis_client.pipeline(transaction=False)
+        for key_id, delta, last_used_at in rows:
+            restore.incrby(f"{USAGE_KEY_PREFIX}{key_id}", delta)
+            restore.set(f"{LAST_USED_KEY_PREFIX}{key_id}", last_used_at.timestamp(), nx=True)
+        await restore.execute()
+    except Exception:
+        logger.error(
+            "Lost API key usage after failed flush: %s",
+            {str(key_id): delta for key_id, delta, _ in rows},
+            exc_info=True,
+        )
+
+
+async def run_usage_flusher(
+    redis_client: aioredis.Redis,
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float = USAGE_FLUSH_INTERVAL_SECONDS,
+    push_interval_seconds: float = USAGE_PUSH_INTERVAL_SECONDS,
+) -> None:
+    """Push counts every *push_interval_seconds* and flush them to Postgres
+    every *interval_seconds* until cancelled.
+
+    On cancellation the remaining in-process counts are pushed to Redis, so
+    the next flush (from any worker) still persists them.
+    """
+    loop = asyncio.get_running_loop()
+    next_flush = loop.time() + interval_seconds
+    try:
+        while True:
+            await asyncio.sleep(push_interval_seconds)
+            await push_usage(redis_client)
+            if loop.time() < next_flush:
+                continue
+            next_flush = loop.time() + interval_seconds
+            try:
+                async with session_factory() as session:
+                    updated = await flush_usage(redis_client, session)
+                if updated:
+                    logger.debug("Flushed API key usage for %d keys", updated)
+            except Exception:
+                logger.warning("Failed to flush API key usage – retrying later", exc_info=True)
+    finally:
+        await push_usage(redis_client)
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _key_id(redis_key: bytes | str) -> str:
+    return _text(redis_key).removeprefix(USAGE_KEY_PREFIX)
@@ -5,7 +5,6 @@ a human-readable PDF report with Executive Summary, scene findings,
 and a To-Do list of safety measures.
 """
 
-import base64
 import io
 import logging
 from collections import defaultdict
@@ -13,6 +12,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+import pybase64
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -235,7 +235,7 @@ def generate_pdf_report(report: dict[str, Any]) -> bytes:
 def generate_pdf_base64(report: dict[str, Any]) -> str:
     """Generate a PDF report and return it as a base64-encoded string."""
     pdf_bytes = generate_pdf_report(report)
-    return base64.b64encode(pdf_bytes).decode("ascii")
+    return pybase64.b64encode_as_string(pdf_bytes)
 
 
 def _escape_html(text: str) -> str:
@@ -5,22 +5,48 @@ in Redis with a configurable TTL.  Temporal activities exchange only opaque
 reference keys -- never raw screenplay content.
 """
 
+import asyncio
+import binascii
 import hashlib
 import json
 import logging
+import os
+import secrets
 from typing import Any
-from uuid import uuid4
 
+import pybase64
 import redis.asyncio as aioredis
+import zstandard
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from core.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
 
-# Key prefix to namespace buffer entries in Redis
+# Key prefix to namespace buffer entries in Redis.  The suffix is 128 random
+# bits as unpadded base64url (22 chars) -- opaque, no UUID formatting.
 _KEY_PREFIX = "eki:buf:"
 
+# Payloads above this size are encrypted/decrypted in a worker thread so
+# multi-MB scripts don't stall the event loop; smaller ones stay inline,
+# where the thread hop would cost more than the crypto.  Reads go by the
+# stored (compressed) size.
+_OFFLOAD_THRESHOLD = 64 * 1024
+
+# Stored values are ``_TOKEN_PREFIX + base64(nonce || AES-GCM ciphertext)``
+# where the plaintext is zstd-compressed first (FDX is XML and shrinks
+# several-fold).  The Redis key is bound in as associated data, so an
+# entry copied under another key fails authentication.  Base64 keeps them
+# ASCII for clients with decode_responses=True.  ':' never occurs in a
+# Fernet token, so older Fernet entries are still recognised and decrypted
+# until their TTL runs out.
+_TOKEN_PREFIX = b"v3:"
+_ZSTD_LEVEL = 3
+_NONCE_SIZE = 12
+_AESGCM_KEY_SALT = b"eki-buf-aesgcm-v2"
+
 
 def _derive_fernet_key(secret: str) -> bytes:
     """Derive a URL-safe base64 Fernet key from an arbitrary secret string.
@@ -34,26 +60,45 @@ def _derive_fernet_key(secret: str) -> bytes:
     return base64.urlsafe_b64encode(digest)
 
 
+def _derive_aesgcm_key(secret: str) -> bytes:
+    """Derive a 256-bit AES-GCM key from the secret, namespaced for the buffer."""
+    return hashlib.sha256(secret.encode("utf-8") + _AESGCM_KEY_SALT).digest()
+
+
 class SecureBuffer:
     """AES-encrypted transient data store backed by Redis.
 
-    Every ``store`` call encrypts the payload with Fernet (AES-128-CBC +
-    HMAC-SHA256), writes it to Redis with a TTL, and returns an opaque
-    reference key.  ``retrieve`` decrypts the blob.  ``delete`` removes
+    Every ``store`` call compresses the payload with zstd, encrypts it with
+    AES-256-GCM (a single AES-NI/CLMUL pass in OpenSSL), writes it to Redis
+    with a TTL, and returns an opaque reference key.  Legacy entries remain
+    readable.  ``retrieve`` decrypts the blob.  ``delete`` removes
     keys explicitly -- Redis TTL serves as a safety net.
+    ``retrieve_and_delete`` combines both for one-shot reads.
     """
 
     def __init__(self, redis_client: aioredis.Redis, secret_key: str, default_ttl: int = 21600):
         self._redis = redis_client
-        self._fernet = Fernet(_derive_fernet_key(secret_key))
+        self._aesgcm = AESGCM(_derive_aesgcm_key(secret_key))
+        self._fernet = Fernet(_derive_fernet_key(secret_key))  # legacy entries
         self._default_ttl = default_ttl  # 6 h
 
     async def store(self, data: dict[str, Any], ttl_seconds: int | None = None) -> str:
         """Encrypt *data* and store it in Redis.  Returns the reference key."""
-        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-        ref_key = f"{_KEY_PREFIX}{uuid4()}"
         plaintext = json.dumps(data, default=str).encode("utf-8")
-        encrypted = self._fernet.encrypt(plaintext)
+        return await self.store_bytes(plaintext, ttl_seconds)
+
+    async def store_bytes(self, data: bytes, ttl_seconds: int | None = None) -> str:
+        """Encrypt raw *data* and store it in Redis.  Returns the reference key.
+
+        For binary payloads such as uploaded scripts: no JSON or base64
+        wrapping before encryption.
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        ref_key = f"{_KEY_PREFIX}{secrets.token_urlsafe(16)}"
+        if len(data) > _OFFLOAD_THRESHOLD:
+            encrypted = await asyncio.to_thread(self._encrypt, data, ref_key)
+        else:
+            encrypted = self._encrypt(data, ref_key)
         await self._redis.setex(ref_key, ttl, encrypted)
         logger.debug("SecureBuffer: stored %s (ttl=%ds)", ref_key, ttl)
         return ref_key
@@ -63,22 +108,59 @@ class SecureBuffer:
 
         Raises ``NotFoundException`` when the key has expired or was deleted.
         """
-        encrypted = await self._redis.get(ref_key)
+        return json.loads(await self.retrieve_bytes(ref_key))
+
+    async def retrieve_bytes(self, ref_key: str) -> bytes:
+        """Retrieve and decrypt the raw payload for *ref_key*.
+
+        Raises ``NotFoundException`` when the key has expired or was deleted.
+        """
+        return await self._decrypt(ref_key, await self._redis.get(ref_key))
+
+    async def retrieve_and_delete(self, ref_key: str) -> dict[str, Any]:
+        """Retrieve, decrypt and delete *ref_key* in one atomic GETDEL.
+
+        For one-shot reads: a concurrent caller can never get the same
+        entry.  Raises ``NotFoundException`` like ``retrieve``.
+        """
+        encrypted = await self._redis.getdel(ref_key)
+        logger.debug("SecureBuffer: consumed %s", ref_key)
+        return json.loads(await self._decrypt(ref_key, encrypted))
+
+    async def _decrypt(self, ref_key: str, encrypted: bytes | str | None) -> bytes:
         if encrypted is None:
             raise NotFoundException(
                 "Buffer key expired or not found",
                 details={"ref_key": ref_key},
             )
+        if isinstance(encrypted, str):
+            encrypted = encrypted.encode("utf-8")
         try:
-            plaintext = self._fernet.decrypt(
-                encrypted if isinstance(encrypted, bytes) else encrypted.encode("utf-8")
-            )
-        except InvalidToken as exc:
+            if len(encrypted) > _OFFLOAD_THRESHOLD:
+                return await asyncio.to_thread(self._decrypt_token, encrypted, ref_key)
+            return self._decrypt_token(encrypted, ref_key)
+        except (InvalidTag, InvalidToken, binascii.Error, zstandard.ZstdError) as exc:
             raise NotFoundException(
                 "Buffer decryption failed (key rotated or corrupted)",
                 details={"ref_key": ref_key},
             ) from exc
-        return json.loads(plaintext)
+
+    def _encrypt(self, data: bytes, ref_key: str) -> bytes:
+        # Module-level zstandard.compress: compressor objects are not
+        # thread-safe, and this runs in worker threads for large payloads.
+        compressed = zstandard.compress(data, _ZSTD_LEVEL)
+        nonce = os.urandom(_NONCE_SIZE)
+        sealed = self._aesgcm.encrypt(nonce, compressed, ref_key.encode())
+        return _TOKEN_PREFIX + pybase64.b64encode(nonce + sealed)
+
+    def _decrypt_token(self, token: bytes, ref_key: str) -> bytes:
+        if not token.startswith(_TOKEN_PREFIX):
+            return self._fernet.decrypt(token)
+        sealed = pybase64.b64decode(token[len(_TOKEN_PREFIX) :], validate=True)
+        compressed = self._aesgcm.decrypt(
+            sealed[:_NONCE_SIZE], sealed[_NONCE_SIZE:], ref_key.encode()
+        )
+        return zstandard.decompress(compressed)
 
     async def delete(self, *ref_keys: str) -> int:
         """Explicitly delete one or more buffer entries.  Returns count deleted."""
@@ -107,9 +107,39 @@ def override_get_redis():
             """Get TTL (return 60 in mock)."""
             return 60
 
+        async def evalsha(self, sha: str, numkeys: int, *args):
+            """Sliding-window rate limit script: always admits."""
+            return [1] + [0] * numkeys
+
+        async def set(self, key: str, value) -> bool:
+            self._store[key] = value
+            return True
+
+        def pipeline(self, transaction: bool = True):
+            return MockPipeline(self)
+
         async def aclose(self):
             pass
 
+    class MockPipeline:
+        """Queue commands and run them against MockRedis on execute()."""
+
+        def __init__(self, redis):
+            self._redis = redis
+            self._commands = []
+
+        def __getattr__(self, name):
+            def _queue(*args, **kwargs):
+                self._commands.append((name, args, kwargs))
+                return self
+            return _queue
+
+        async def execute(self):
+            return [
+                await getattr(self._redis, name)(*args, **kwargs)
+                for name, args, kwargs in self._commands
+            ]
+
     async def _override():
         yield MockRedis()
 
@@ -18,6 +18,18 @@ class TestHealthEndpoints:
         assert "timestamp" in data
         assert data["version"] == "0.1.0"
 
+    def test_health_body_matches_model_serialization(self, client):
+        """The spliced /health body keeps HealthResponse's timestamp format."""
+        from datetime import datetime
+
+        from core.models import HealthResponse
+
+        body = client.get("/health").json()
+        timestamp = datetime.fromisoformat(body["timestamp"])
+        expected = HealthResponse(timestamp=timestamp, version=body["version"])
+        assert body == expected.model_dump(mode="json")
+        assert timestamp.tzinfo is None
+
     @pytest.mark.asyncio
     async def test_readiness_check(self, client, auth_headers):
         """Test readiness check endpoint."""
@@ -29,6 +41,40 @@ class TestHealthEndpoints:
         assert "services" in data
         assert "timestamp" in data
 
+    def test_readiness_results_are_cached(self, client, auth_headers, monkeypatch):
+        """Repeated probes within the cache window reuse one dependency check."""
+        from api.routers import health
+        from core.models import ReadinessResponse
+
+        probes = 0
+
+        async def fake_probe(db, redis):
+            nonlocal probes
+            probes += 1
+            return ReadinessResponse(
+                status="not_ready",
+                timestamp="2026-01-01T00:00:00",
+                services={"database": True, "redis": False, "temporal": True},
+            )
+
+        monkeypatch.setattr(health, "_probe_dependencies", fake_probe)
+        monkeypatch.setattr(health, "_readiness_cache", None)
+
+        responses = [client.get("/ready", headers=auth_headers) for _ in range(3)]
+
+        assert probes == 1
+        assert all(r.status_code == status.HTTP_503_SERVICE_UNAVAILABLE for r in responses)
+
+    def test_cached_readiness_response_is_immutable(self):
+        """The shared cached readiness result cannot be altered by a caller."""
+        from pydantic import ValidationError
+
+        from core.models import ReadinessResponse
+
+        ready = ReadinessResponse(status="ready", services={"database": True})
+        with pytest.raises(ValidationError):
+            ready.status = "not_ready"
+
 
 class TestSecurityEndpoints:
     """Tests for security check endpoints."""
@@ -51,6 +97,29 @@ class TestSecurityEndpoints:
         assert "message" in data
         assert data["report"]["project_id"] == "test-project-123"
 
+    @pytest.mark.asyncio
+    async def test_sync_check_stub_matches_response_model(self, client, auth_headers):
+        """The prebuilt stub body validates and gets fresh ids per request."""
+        from core.models import SyncSecurityCheckResponse
+
+        payload = {
+            "script_content": base64.b64encode(b"%PDF-1.7 stub").decode(),
+            "script_format": "pdf",
+            "project_id": "test-project-123",
+        }
+
+        first, second = (
+            SyncSecurityCheckResponse.model_validate(
+                client.post("/v1/security/check", json=payload, headers=auth_headers).json()
+            )
+            for _ in range(2)
+        )
+
+        assert first.report.script_format == "pdf"
+        assert first.report.metadata["stub"] is True
+        assert first.report.report_id != second.report.report_id
+        assert first.report.findings[0].id != second.report.findings[0].id
+
     def test_sync_check_missing_auth(self, client):
         """Test synchronous security check without authentication."""
         script_content = base64.b64encode(b"Test script content").decode()
@@ -180,3 +249,46 @@ class TestValidation:
 
         response = client.post("/v1/security/check:async", json=payload, headers=auth_headers)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_validation_error_body_matches_error_response(self, client, auth_headers):
+        """Handler-built error bodies conform to the documented ErrorResponse."""
+        from core.models import ErrorResponse
+
+        response = client.get(
+            "/v1/security/jobs/not-a-uuid",
+            headers={**auth_headers, "X-Request-ID": "req-42"},
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        error = ErrorResponse.model_validate(response.json())
+        assert error.error == "ValidationError"
+        assert error.request_id == "req-42"
+        assert error.details[0].field == "path.job_id"
+        assert error.details[0].error_code == "uuid_parsing"
+
+
+class TestCORS:
+    """Tests for CORS preflight handling."""
+
+    def test_preflight_allows_configured_origin_and_headers(self, client):
+        response = client.options(
+            "/v1/security/check",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, x-actor-user-id",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+    def test_preflight_rejects_unlisted_header(self, client):
+        response = client.options(
+            "/v1/security/check",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "x-not-allowed",
+            },
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,216 @@
+"""Tests for batched API key usage tracking (services.api_key_usage)."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services import api_key_usage
+from services.api_key_usage import (
+    LAST_USED_KEY_PREFIX,
+    USAGE_KEY_PREFIX,
+    flush_usage,
+    push_usage,
+    record_usage,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_pending_usage():
+    api_key_usage._pending.clear()
+    yield
+    api_key_usage._pending.clear()
+
+
+class FakeRedis:
+    """Minimal in-memory Redis with the commands used for usage tracking."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def incr(self, key):
+        return await self.incrby(key, 1)
+
+    async def incrby(self, key, amount):
+        self.store[key] = str(int(self.store.get(key, 0)) + amount)
+        return int(self.store[key])
+
+    async def set(self, key, value, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def getdel(self, key):
+        return self.store.pop(key, None)
+
+    async def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self):
+        return [
+            await getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+
+
+class FakeSession:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, stmt):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.statements.append(stmt)
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_push_usage_coalesces_counts_into_one_round_trip():
+    redis = FakeRedis()
+    key_id = uuid4()
+    pushes = []
+    original_pipeline = redis.pipeline
+
+    def counting_pipeline(transaction=True):
+        pushes.append(1)
+        return original_pipeline(transaction)
+
+    redis.pipeline = counting_pipeline
+
+    for _ in range(3):
+        record_usage(key_id)
+    assert redis.store == {}
+
+    assert await push_usage(redis) == 1
+    assert len(pushes) == 1
+    assert redis.store[f"{USAGE_KEY_PREFIX}{key_id}"] == "3"
+    assert f"{LAST_USED_KEY_PREFIX}{key_id}" in redis.store
+    assert await push_usage(redis) == 0
+
+
+@pytest.mark.asyncio
+async def test_push_usage_keeps_counts_on_redis_errors():
+    class BrokenRedis:
+        def pipeline(self, transaction=True):
+            raise ConnectionError("redis down")
+
+    key_id = uuid4()
+    record_usage(key_id, 1.0)
+    record_usage(key_id, 2.0)
+
+    assert await push_usage(BrokenRedis()) == 0
+    assert api_key_usage._pending[key_id] == (2, 2.0)
+
+
+@pytest.mark.asyncio
+async def test_flush_usage_drains_counters_in_one_update():
+    redis = FakeRedis()
+    first, second = uuid4(), uuid4()
+    for _ in range(3):
+        record_usage(first)
+    record_usage(second)
+    await push_usage(redis)
+
+    session = FakeSession()
+    updated = await flush_usage(redis, session)
+
+    assert updated == 2
+    assert session.committed
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE api_keys" in sql and "VALUES" in sql
+    assert redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_usage_restores_counters_on_db_failure():
+    redis = FakeRedis()
+    key_id = uuid4()
+    for _ in range(2):
+        record_usage(key_id, 1_700_000_000.0)
+    await push_usage(redis)
+
+    with pytest.raises(RuntimeError):
+        await flush_usage(redis, FakeSession(fail=True))
+
+    assert redis.store[f"{USAGE_KEY_PREFIX}{key_id}"] == "2"
+    assert redis.store[f"{LAST_USED_KEY_PREFIX}{key_id}"] == 1_700_000_000.0
+
+
+@pytest.mark.asyncio
+async def test_flush_usage_restore_keeps_newer_last_used():
+    redis = FakeRedis()
+    key_id = uuid4()
+    record_usage(key_id, 1_700_000_000.0)
+    await push_usage(redis)
+
+    class PushDuringFlushSession(FakeSession):
+        async def execute(self, stmt):
+            record_usage(key_id, 1_700_000_100.0)
+            await push_usage(redis)
+            raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await flush_usage(redis, PushDuringFlushSession())
+
+    assert redis.store[f"{USAGE_KEY_PREFIX}{key_id}"] == "2"
+    assert redis.store[f"{LAST_USED_KEY_PREFIX}{key_id}"] == 1_700_000_100.0
+
+
+@pytest.mark.asyncio
+async def test_flush_usage_logs_counts_it_cannot_restore(caplog):
+    redis = FakeRedis()
+    key_id = uuid4()
+    record_usage(key_id)
+    await push_usage(redis)
+
+    class FailingRestoreSession(FakeSession):
+        async def execute(self, stmt):
+            def broken_pipeline(transaction=True):
+                raise ConnectionError("redis down")
+
+            redis.pipeline = broken_pipeline
+            raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await flush_usage(redis, FailingRestoreSession())
+
+    assert f"'{key_id}': 1" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_record_usage_stores_epoch_seconds():
+    redis = FakeRedis()
+    key_id = uuid4()
+
+    record_usage(key_id, 1_700_000_000.5)
+    await push_usage(redis)
+
+    assert redis.store[f"{LAST_USED_KEY_PREFIX}{key_id}"] == 1_700_000_000.5
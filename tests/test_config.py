@@ -100,3 +100,28 @@ def test_llm_provider_unknown_value_is_rejected(monkeypatch):
     assert "Invalid LLM_PROVIDER" in err
     assert "mistral_cloud" in err
     assert "ollama" in err
+
+
+def test_url_strings_follow_copies_and_assignment():
+    """Cached URL strings are rebuilt when their source field changes."""
+    settings = Settings(redis_url="redis://a:6379/0")
+    assert settings.redis_url_s == "redis://a:6379/0"
+
+    copied = settings.model_copy(update={"redis_url": "redis://b:6379/1"})
+    assert copied.redis_url_s == "redis://b:6379/1"
+    assert settings.redis_url_s == "redis://a:6379/0"
+
+    settings.redis_url = "redis://c:6379/2"
+    assert settings.redis_url_s == "redis://c:6379/2"
+    assert settings.database_url_s == str(settings.database_url)
+
+
+def test_environment_flags_follow_copies_and_assignment():
+    """is_production/is_development track env after validation."""
+    settings = Settings(env="development")
+    assert settings.is_development and not settings.is_production
+
+    assert settings.model_copy(update={"env": "stage"}).is_development is False
+
+    settings.env = "production"
+    assert settings.is_production and not settings.is_development
@@ -341,6 +341,56 @@ class TestSecureBuffer:
         retrieved = await buffer.retrieve(ref_key)
         assert retrieved == data
 
+    @pytest.mark.asyncio
+    async def test_store_and_retrieve_bytes(self, buffer, mock_redis):
+        data = b"%PDF-1.7\x00\xff binary"
+
+        ref_key = await buffer.store_bytes(data)
+        assert ref_key.startswith("eki:buf:")
+        assert len(ref_key) == len("eki:buf:") + 22
+        assert ref_key != await buffer.store_bytes(data)
+
+        mock_redis.get.return_value = mock_redis.setex.call_args_list[0].args[2]
+        assert await buffer.retrieve_bytes(ref_key) == data
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_are_encrypted_off_the_event_loop(
+        self, buffer, mock_redis, monkeypatch
+    ):
+        import asyncio
+        import os
+
+        offloaded = []
+        real_to_thread = asyncio.to_thread
+
+        async def counting_to_thread(func, *args):
+            offloaded.append(func.__name__)
+            return await real_to_thread(func, *args)
+
+        monkeypatch.setattr("services.secure_buffer.asyncio.to_thread", counting_to_thread)
+
+        await buffer.store_bytes(b"small")
+        assert offloaded == []
+
+        data = os.urandom(1024 * 1024)  # incompressible: stays large when stored
+        ref_key = await buffer.store_bytes(data)
+        mock_redis.get.return_value = mock_redis.setex.call_args.args[2]
+        assert await buffer.retrieve_bytes(ref_key) == data
+        assert offloaded == ["_encrypt", "_decrypt_token"]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_and_delete_uses_getdel(self, buffer, mock_redis):
+        ref_key = await buffer.store({"report": {"total_findings": 3}})
+        mock_redis.getdel = AsyncMock(return_value=mock_redis.setex.call_args.args[2])
+
+        assert await buffer.retrieve_and_delete(ref_key) == {"report": {"total_findings": 3}}
+        mock_redis.getdel.assert_awaited_once_with(ref_key)
+        mock_redis.get.assert_not_called()
+
+        mock_redis.getdel.return_value = None
+        with pytest.raises(NotFoundException, match="expired or not found"):
+            await buffer.retrieve_and_delete(ref_key)
+
     @pytest.mark.asyncio
     async def test_retrieve_expired_raises(self, buffer, mock_redis):
         mock_redis.get.return_value = None
@@ -360,6 +410,44 @@ class TestSecureBuffer:
         assert count == 0
         mock_redis.delete.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_stores_aesgcm_and_reads_legacy_fernet(self, buffer, mock_redis):
+        from cryptography.fernet import Fernet
+
+        await buffer.store_bytes(b"payload")
+        stored = mock_redis.setex.call_args.args[2]
+        assert stored.startswith(b"v3:")
+
+        legacy = Fernet(_derive_fernet_key("test-secret-key-at-least-32-chars"))
+        mock_redis.get.return_value = legacy.encrypt(b"written before upgrade").decode()
+        assert await buffer.retrieve_bytes("eki:buf:old") == b"written before upgrade"
+
+    @pytest.mark.asyncio
+    async def test_payloads_are_compressed(self, buffer, mock_redis):
+        fdx = b"<Paragraph Type=\"Action\"><Text>Stunt.</Text></Paragraph>" * 2000
+        ref_key = await buffer.store_bytes(fdx)
+        stored = mock_redis.setex.call_args.args[2]
+        assert len(stored) < len(fdx) // 5
+
+        mock_redis.get.return_value = stored
+        assert await buffer.retrieve_bytes(ref_key) == fdx
+
+    @pytest.mark.asyncio
+    async def test_tampered_entry_raises(self, buffer, mock_redis):
+        await buffer.store_bytes(b"payload")
+        stored = mock_redis.setex.call_args.args[2]
+        mock_redis.get.return_value = stored[:-4] + (b"AAAA" if stored[-4:] != b"AAAA" else b"BBBB")
+        with pytest.raises(NotFoundException, match="decryption failed"):
+            await buffer.retrieve_bytes("eki:buf:x")
+
+    @pytest.mark.asyncio
+    async def test_entry_copied_to_another_key_raises(self, buffer, mock_redis):
+        ref_key = await buffer.store_bytes(b"payload")
+        mock_redis.get.return_value = mock_redis.setex.call_args.args[2]
+        assert await buffer.retrieve_bytes(ref_key) == b"payload"
+        with pytest.raises(NotFoundException, match="decryption failed"):
+            await buffer.retrieve_bytes("eki:buf:other")
+
     def test_derive_fernet_key_deterministic(self):
         key1 = _derive_fernet_key("my-secret")
         key2 = _derive_fernet_key("my-secret")
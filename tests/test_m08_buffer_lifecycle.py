@@ -169,8 +169,8 @@ class TestPullEndpointDeletesBufferAfterRetrieval:
         # Patch SecureBuffer-Konstruktion in api.routers.security:_get_buffer
         fake_report_package = _push_report_package()
         fake_buffer = AsyncMock()
-        fake_buffer.retrieve = AsyncMock(return_value=fake_report_package)
-        fake_buffer.delete = AsyncMock(return_value=1)
+        # Abruf und Loeschen laufen atomar in einem GETDEL.
+        fake_buffer.retrieve_and_delete = AsyncMock(return_value=fake_report_package)
 
         with patch("api.routers.security.SecureBuffer", return_value=fake_buffer):
             resp = client.get(
@@ -178,7 +178,7 @@ class TestPullEndpointDeletesBufferAfterRetrieval:
             )
 
         assert resp.status_code == 200
-        fake_buffer.delete.assert_awaited_once_with(report_ref_key)
+        fake_buffer.retrieve_and_delete.assert_awaited_once_with(report_ref_key)
 
         # Zweite Anfrage muss 410 liefern (One-Shot).
         with patch("api.routers.security.SecureBuffer", return_value=fake_buffer):
@@ -223,3 +223,46 @@ class TestStripThinkingTags:
     def test_returns_empty_string_for_only_thinking(self) -> None:
         text = "<think>nothing else</think>"
         assert OllamaProvider._strip_thinking_tags(text) == ""
+
+
+# ---------------------------------------------------------------------------
+# get_llm_provider caching
+# ---------------------------------------------------------------------------
+
+
+class TestProviderFactory:
+    """get_llm_provider reuses one instance per configuration."""
+
+    def test_same_settings_return_same_instance(self) -> None:
+        from api.config import get_settings
+        from llm.factory import get_llm_provider
+
+        settings = get_settings().model_copy(update={"llm_provider": "ollama"})
+        first = get_llm_provider(settings)
+        assert isinstance(first, OllamaProvider)
+        assert get_llm_provider(settings) is first
+
+        other = settings.model_copy(update={"ollama_model": "another-model"})
+        assert get_llm_provider(other) is not first
+        assert get_llm_provider(other).model == "another-model"
+
+    @pytest.mark.asyncio
+    async def test_provider_reuses_one_http_client_until_closed(self) -> None:
+        from api.config import get_settings
+        from llm.factory import _providers, close_llm_providers, get_llm_provider
+
+        settings = get_settings().model_copy(
+            update={"llm_provider": "ollama", "ollama_model": "pooled-model"}
+        )
+        provider = get_llm_provider(settings)
+        fake = _mock_chat_response('{"x": 1}')
+        with patch("httpx.AsyncClient.post", new=AsyncMock(return_value=fake)):
+            await provider.generate_structured(prompt="Szene 1", schema=_SIMPLE_SCHEMA)
+            client = provider._client
+            await provider.generate_structured(prompt="Szene 2", schema=_SIMPLE_SCHEMA)
+        assert client is not None and provider._client is client
+
+        await close_llm_providers()
+        assert client.is_closed
+        assert provider._client is None
+        assert _providers == {}
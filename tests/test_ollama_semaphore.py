@@ -11,7 +11,7 @@ Strategie:
   wäre), zählt beim Verlassen wieder herunter.
 * Beobachtetes Maximum wird gegen den konfigurierten Cap geprüft.
 * ``_get_throttle_config`` wird direkt monkey-gepatcht statt
-  ``get_settings()``, damit die lru_cache-Semantik der Settings nicht
+  ``get_settings()``, damit das Settings-Singleton nicht
   beeinflusst wird und auch keine echten env vars benötigt werden.
 """
 
@@ -0,0 +1,143 @@
+"""Tests for Redis-backed rate limiting (api.rate_limiting)."""
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import NoScriptError
+from starlette.requests import Request
+
+from api.config import Settings
+from api.dependencies import hash_api_key
+from api.rate_limiting import rate_limit_by_ip, rate_limit_combined
+
+
+class FakeRedis:
+    """Emulates the sliding-window Lua script; EVALSHA misses until EVAL ran."""
+
+    def __init__(self):
+        self.windows: dict[str, list[int]] = {}
+        self.script_loaded = False
+        self.eval_calls = 0
+        self.round_trips = 0
+
+    async def evalsha(self, sha, numkeys, *args):
+        self.round_trips += 1
+        if not self.script_loaded:
+            raise NoScriptError("NOSCRIPT No matching script")
+        return self._hit(numkeys, *args)
+
+    async def eval(self, script, numkeys, *args):
+        self.round_trips += 1
+        self.eval_calls += 1
+        self.script_loaded = True
+        return self._hit(numkeys, *args)
+
+    def _hit(self, numkeys, *args):
+        keys, (now, _member, *limits) = args[:numkeys], args[numkeys:]
+        result = [1]
+        for i, key in enumerate(keys):
+            window, limit = limits[2 * i], limits[2 * i + 1]
+            entries = [t for t in self.windows.get(key, []) if t > now - window]
+            self.windows[key] = entries
+            if len(entries) < limit:
+                result.append(0)
+            else:
+                result[0] = 0
+                result.append(entries[0] + window - now)
+        if result[0]:
+            for key in keys:
+                self.windows[key].append(now)
+        return result
+
+
+def _request(ip: str = "203.0.113.7", token: str | None = None) -> Request:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "headers": headers, "client": (ip, 12345)})
+
+
+@pytest.mark.asyncio
+async def test_ip_limit_rejects_after_limit_with_retry_after():
+    redis = FakeRedis()
+    settings = Settings(rate_limit_per_minute=2)
+
+    await rate_limit_by_ip(_request(), redis, settings)
+    await rate_limit_by_ip(_request(), redis, settings)
+    with pytest.raises(HTTPException) as exc_info:
+        await rate_limit_by_ip(_request(), redis, settings)
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers["Retry-After"] == "60"
+
+
+@pytest.mark.asyncio
+async def test_noscript_falls_back_to_eval_once():
+    redis = FakeRedis()
+    settings = Settings(rate_limit_per_minute=10)
+
+    for _ in range(3):
+        await rate_limit_by_ip(_request(), redis, settings)
+
+    assert redis.eval_calls == 1
+    assert len(redis.windows["rate_limit:sw:ip:203.0.113.7"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_combined_limit_charges_both_buckets_in_one_round_trip():
+    redis = FakeRedis()
+    redis.script_loaded = True
+    settings = Settings(rate_limit_per_minute=10, rate_limit_per_hour=1)
+
+    await rate_limit_combined(_request(token="eki_abc"), redis, settings)
+
+    assert redis.round_trips == 1
+    assert sorted(redis.windows) == [
+        "rate_limit:sw:api_key:" + hash_api_key("eki_abc")[:16],
+        "rate_limit:sw:ip:203.0.113.7",
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await rate_limit_combined(_request(token="eki_abc"), redis, settings)
+    assert exc_info.value.headers["Retry-After"] == "3600"
+
+
+@pytest.mark.asyncio
+async def test_ip_rejection_does_not_charge_api_key_bucket():
+    """A flood from one address cannot drain a key's hourly quota."""
+    redis = FakeRedis()
+    redis.script_loaded = True
+    settings = Settings(rate_limit_per_minute=1, rate_limit_per_hour=100)
+    key_bucket = "rate_limit:sw:api_key:" + hash_api_key("eki_abc")[:16]
+
+    await rate_limit_combined(_request(token="eki_abc"), redis, settings)
+    for _ in range(5):
+        with pytest.raises(HTTPException):
+            await rate_limit_combined(_request(token="eki_abc"), redis, settings)
+
+    assert len(redis.windows[key_bucket]) == 1
+    await rate_limit_combined(_request(ip="198.51.100.1", token="eki_abc"), redis, settings)
+    assert len(redis.windows[key_bucket]) == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_allow_request():
+    class BrokenRedis:
+        async def evalsha(self, *args):
+            raise ConnectionError("redis down")
+
+    await rate_limit_by_ip(_request(), BrokenRedis(), Settings())
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_admits_again_once_oldest_request_ages_out(monkeypatch):
+    redis = FakeRedis()
+    redis.script_loaded = True
+    settings = Settings(rate_limit_per_minute=2)
+    clock = iter([1000.0, 1030.0, 1059.0, 1060.5])
+    monkeypatch.setattr("api.rate_limiting.time.time", lambda: next(clock))
+
+    await rate_limit_by_ip(_request(), redis, settings)  # t=1000
+    await rate_limit_by_ip(_request(), redis, settings)  # t=1030
+    with pytest.raises(HTTPException) as exc_info:
+        await rate_limit_by_ip(_request(), redis, settings)  # t=1059
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+    await rate_limit_by_ip(_request(), redis, settings)  # t=1060.5, first aged out
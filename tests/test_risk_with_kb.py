@@ -30,7 +30,7 @@ def _settings(*, enabled: bool, top_k: int = 3, max_chars: int = 600) -> SimpleN
         kb_default_tenant_id="00000000-0000-0000-0000-000000000001",
         kb_top_k=top_k,
         kb_max_chunk_chars_in_prompt=max_chars,
-        database_url="postgresql+asyncpg://test/test",
+        database_url_s="postgresql+asyncpg://test/test",
         api_secret_key="unit-test-secret",
         llm_provider="ollama",
     )
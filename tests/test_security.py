@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 from uuid import uuid4
 
 import pytest
-from fastapi import status
+from fastapi import HTTPException, status
+from sqlalchemy.dialects import postgresql
 
+from api.routers.security import _claim_report_stmt
 from core.db_models import ApiKeyModel, JobMetadata, ReportMetadata
 from core.prompt_sanitizer import PromptSanitizer
 
@@ -147,6 +149,68 @@ class TestAuthentication:
         response = client.post("/v1/security/check", json=payload, headers=auth_headers)
         assert response.status_code == status.HTTP_200_OK
 
+    @pytest.mark.asyncio
+    async def test_validated_api_key_is_cached(self, client, db_session, test_api_key):
+        """Deactivation is served stale from the cache until the TTL runs out."""
+        import time
+
+        from api import dependencies
+
+        api_key, api_key_model = test_api_key
+        headers = {"Authorization": f"Bearer {api_key}"}
+
+        response = client.get(f"/v1/security/jobs/{uuid4()}", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        # Deactivate in the DB: the cached snapshot still authenticates ...
+        api_key_model.is_active = False
+        await db_session.commit()
+        response = client.get(f"/v1/security/jobs/{uuid4()}", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        # ... until the entry expires, at most 30 s later.
+        assert dependencies._API_KEY_CACHE_TTL_SECONDS == 30
+        expired = dependencies._api_key_cache.expire(
+            time.monotonic() + dependencies._API_KEY_CACHE_TTL_SECONDS
+        )
+        assert dependencies.hash_api_key(api_key) in dict(expired)
+        response = client.get(f"/v1/security/jobs/{uuid4()}", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.get(f"/v1/security/jobs/{uuid4()}", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cache_misses_share_one_lookup(self):
+        """A burst of misses for the same key issues a single DB query."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from api import dependencies
+
+        class SlowDB:
+            queries = 0
+
+            async def execute(self, stmt, params):
+                SlowDB.queries += 1
+                await asyncio.sleep(0.01)
+                row = SimpleNamespace(
+                    id=uuid4(),
+                    user_id="burst-user",
+                    organization_id=None,
+                    expires_at=datetime.utcnow() + timedelta(days=1),
+                )
+                return SimpleNamespace(one_or_none=lambda: row)
+
+        token_hash = "burst" + "0" * 59
+        results = await asyncio.gather(
+            *(dependencies._lookup_api_key(SlowDB(), token_hash, 0.0) for _ in range(5))
+        )
+        dependencies._api_key_cache.pop(token_hash, None)
+
+        assert SlowDB.queries == 1
+        assert len({r.id for r in results}) == 1
+        assert dependencies._api_key_lookups == {}
+
 
 class TestAuthorization:
     """Tests for authorization and IDOR prevention."""
@@ -278,6 +342,114 @@ class TestAuthorization:
         assert response.status_code == status.HTTP_410_GONE
         assert "already retrieved" in response.json()["detail"].lower()
 
+    def test_report_claim_is_single_statement_on_postgres(self):
+        """The PostgreSQL claim folds UPDATE and existence check into one query."""
+        stmt = _claim_report_stmt(uuid4(), "test-user-123")
+
+        (join,) = stmt.get_final_froms()
+        assert join.isouter
+        assert (join.left.name, join.right.name) == ("cur", "upd")
+        upd = join.right.element
+        assert upd.is_update and upd.table.name == "report_metadata"
+        columns = ["report_id", "report_ref_key", "retrieved_at"]
+        assert list(upd.exported_columns.keys()) == columns
+        assert [c.name for c in stmt.selected_columns] == columns
+        # Compiles for PostgreSQL as one statement with both CTEs.
+        sql = stmt.compile(dialect=postgresql.dialect()).string
+        assert sql.split(None, 1)[0] == "WITH"
+
+
+class TestAsyncJobCreation:
+    """Ordering of job creation and payload buffering in check:async."""
+
+    @pytest.fixture
+    def fake_db(self):
+        from types import SimpleNamespace
+
+        class FakeDB:
+            def __init__(self):
+                self.statements = []
+                self.existing_job_id = None
+
+            async def execute(self, stmt, params=None):
+                self.statements.append(stmt)
+                params = stmt.compile().params
+                row = SimpleNamespace(
+                    job_id=self.existing_job_id or params.get("job_id"),
+                    status="pending",
+                )
+                return SimpleNamespace(one=lambda: row)
+
+            async def commit(self):
+                pass
+
+        return FakeDB()
+
+    @pytest.fixture
+    def fake_buffer(self, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        from api.routers import security
+
+        buffer = AsyncMock()
+        buffer.store_bytes.return_value = "eki:buf:new"
+        monkeypatch.setattr(security, "_get_buffer", lambda redis_client: buffer)
+        return buffer
+
+    def _resolve(self, monkeypatch, idempotency_key):
+        from api.routers import security
+        from core.models import ScriptFormat
+
+        async def resolve(request, model):
+            return security.ResolvedRequest(
+                content=b"script",
+                script_format=ScriptFormat.FDX,
+                project_id="p1",
+                metadata={},
+                idempotency_key=idempotency_key,
+            )
+
+        monkeypatch.setattr(security, "_resolve_request", resolve)
+
+    @pytest.mark.asyncio
+    async def test_idempotent_replay_does_not_store_payload(
+        self, monkeypatch, fake_db, fake_buffer
+    ):
+        from unittest.mock import AsyncMock
+
+        from api.routers.security import security_check_async
+
+        self._resolve(monkeypatch, "idem-1")
+        fake_db.existing_job_id = uuid4()
+        temporal = AsyncMock()
+
+        response = await security_check_async(None, temporal, None, fake_db, {"user_id": "u1"})
+
+        assert response.job_id == fake_db.existing_job_id
+        fake_buffer.store_bytes.assert_not_called()
+        temporal.start_workflow.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("idempotency_key", ["idem-2", None])
+    async def test_failed_store_marks_job_failed(
+        self, monkeypatch, fake_db, fake_buffer, idempotency_key
+    ):
+        from unittest.mock import AsyncMock
+
+        from api.routers.security import security_check_async
+
+        self._resolve(monkeypatch, idempotency_key)
+        fake_buffer.store_bytes.side_effect = ConnectionError("redis down")
+        temporal = AsyncMock()
+
+        with pytest.raises(ConnectionError):
+            await security_check_async(None, temporal, None, fake_db, {"user_id": "u1"})
+
+        update = fake_db.statements[-1]
+        assert update.is_update
+        assert update.compile().params["status"] == "failed"
+        temporal.start_workflow.assert_not_called()
+
 
 class TestInputValidation:
     """Tests for input validation security."""
@@ -295,6 +467,66 @@ class TestInputValidation:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         assert "base64" in str(response.json()).lower()
 
+    def test_wrong_format_rejected_from_probe(self, monkeypatch):
+        """Large payloads failing the format probe are never fully decoded."""
+        import pybase64
+        from pydantic import ValidationError
+
+        from core import models
+
+        decoded_lengths = []
+        real_decode = pybase64.b64decode
+
+        def counting_decode(s, *args, **kwargs):
+            decoded_lengths.append(len(s))
+            return real_decode(s, *args, **kwargs)
+
+        monkeypatch.setattr(models.pybase64, "b64decode", counting_decode)
+        content = base64.b64encode(b"not a pdf" * 100_000).decode()
+
+        with pytest.raises(ValidationError, match="valid PDF"):
+            models.SecurityCheckRequest(
+                script_content=content, script_format="pdf", project_id="p1"
+            )
+        assert decoded_lengths == [models._B64_PROBE_CHARS]
+
+        # Corruption past the probed prefix is still caught by the full decode.
+        fdx = base64.b64encode(b"<FinalDraft>" * 1000).decode()
+        with pytest.raises(ValidationError, match="base64"):
+            models.SecurityCheckRequest(
+                script_content=fdx[:-8] + "!!!!" + fdx[-4:], script_format="fdx", project_id="p1"
+            )
+
+    @pytest.mark.asyncio
+    async def test_malformed_json_body(self, client, auth_headers):
+        """Test rejection of a body that is not valid JSON."""
+        response = client.post(
+            "/v1/security/check",
+            content=b'{"script_content": ',
+            headers={**auth_headers, "Content-Type": "application/json"},
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "invalid json" in str(response.json()).lower()
+
+    @pytest.mark.parametrize(
+        ("filename", "form"),
+        [
+            ("script.txt", {}),
+            ("fdx", {}),
+            ("script.fdx", {"script_format": "docx"}),
+        ],
+    )
+    def test_multipart_unsupported_format(self, client, auth_headers, filename, form):
+        """Test rejection of unknown upload extensions and script_format values."""
+        response = client.post(
+            "/v1/security/check",
+            files={"file": (filename, b"<FinalDraft/>", "application/xml")},
+            data={"project_id": "test123", **form},
+            headers=auth_headers,
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "unsupported" in str(response.json()).lower()
+
     @pytest.mark.asyncio
     async def test_script_size_limit(self, client, auth_headers):
         """Test rejection of oversized scripts."""
@@ -344,14 +576,19 @@ class TestInputValidation:
             )
 
     @pytest.mark.asyncio
-    async def test_ssrf_private_https_ip_blocked_before_domain_check(self, client, auth_headers):
-        """Test private HTTPS IPs are rejected explicitly as internal addresses."""
+    @pytest.mark.parametrize(
+        "host", ["192.168.1.10", "100.64.0.1", "224.0.0.1", "[fe80::1]", "[ff02::1]"]
+    )
+    async def test_ssrf_private_https_ip_blocked_before_domain_check(
+        self, client, auth_headers, host
+    ):
+        """Test non-global HTTPS IPs are rejected explicitly as internal addresses."""
         script_content = base64.b64encode(b"Test").decode()
         payload = {
             "script_content": script_content,
             "script_format": "fdx",
             "project_id": "test123",
-            "callback_url": "https://192.168.1.10/callback",
+            "callback_url": f"https://{host}/callback",
         }
 
         response = client.post("/v1/security/check", json=payload, headers=auth_headers)
@@ -378,6 +615,22 @@ class TestInputValidation:
             or "whitelist" in str(response.json()).lower()
         )
 
+    @pytest.mark.parametrize(
+        "url",
+        ["https://epro.filmakademie.de/cb", "https://EPRO.Filmakademie.de./cb"],
+    )
+    def test_whitelisted_callback_host_spellings(self, url):
+        """Upper-case and trailing-dot spellings of an allowed host pass."""
+        from core.models import SecurityCheckRequest
+
+        req = SecurityCheckRequest(
+            script_content=base64.b64encode(b"<FinalDraft/>").decode(),
+            script_format="fdx",
+            project_id="test123",
+            callback_url=url,
+        )
+        assert req.callback_url is not None
+
     @pytest.mark.asyncio
     async def test_project_id_sql_injection_prevention(self, client, auth_headers):
         """Test SQL injection prevention in project_id."""
@@ -401,6 +654,15 @@ class TestInputValidation:
             response = client.post("/v1/security/check", json=payload, headers=auth_headers)
             assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+    def test_project_id_pattern_checked_once_but_documented(self):
+        """The format is validated in Python only, yet stays in the schema."""
+        from core.models import SecurityCheckRequest
+
+        field = SecurityCheckRequest.model_fields["project_id"]
+        assert not any(hasattr(m, "pattern") for m in field.metadata)
+        schema = SecurityCheckRequest.model_json_schema()["properties"]["project_id"]
+        assert schema["pattern"] == "^[a-zA-Z0-9_-]+$"
+
     @pytest.mark.asyncio
     async def test_metadata_limits(self, client, auth_headers):
         """Test metadata field limits."""
@@ -420,6 +682,72 @@ class TestInputValidation:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         assert "too many" in str(response.json()).lower() or "50" in str(response.json())
 
+    @pytest.mark.asyncio
+    async def test_metadata_key_trailing_newline_rejected(self, client, auth_headers):
+        """A trailing newline must not sneak past the metadata key check."""
+        payload = {
+            "script_content": base64.b64encode(b"Test").decode(),
+            "script_format": "fdx",
+            "project_id": "test123",
+            "metadata": {"key\n": "value"},
+        }
+
+        response = client.post("/v1/security/check", json=payload, headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "Invalid metadata key format" in str(response.json())
+
+    def test_oversized_upload_rejected_from_content_length(self, client, auth_headers, monkeypatch):
+        """A declared body over the limit is refused before form parsing."""
+        from starlette.requests import Request
+
+        from api.routers import security
+
+        async def no_form(self):
+            raise AssertionError("form() must not be called")
+
+        monkeypatch.setattr(security, "_max_upload_size", lambda: 1024)
+        monkeypatch.setattr(Request, "form", no_form)
+        response = client.post(
+            "/v1/security/check",
+            files={"file": ("script.fdx", b"A" * (128 * 1024), "application/xml")},
+            data={"project_id": "test123"},
+            headers=auth_headers,
+        )
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    @pytest.mark.asyncio
+    async def test_chunked_upload_stops_at_size_limit(self, monkeypatch):
+        """Without Content-Length the body stops being read past the limit."""
+        from starlette.requests import Request
+
+        from api.routers import security
+
+        monkeypatch.setattr(security, "_max_upload_size", lambda: 100 * 1024)
+        head = (
+            b"--xyz\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="a.fdx"\r\n'
+            b"Content-Type: application/xml\r\n\r\n"
+        )
+        reads = 0
+
+        async def receive():
+            nonlocal reads
+            reads += 1
+            body = head if reads == 1 else b"A" * (64 * 1024)
+            return {"type": "http.request", "body": body, "more_body": True}
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"content-type", b"multipart/form-data; boundary=xyz")],
+        }
+        with pytest.raises(HTTPException) as exc_info:
+            await security._resolve_multipart(Request(scope, receive))
+
+        assert exc_info.value.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        # 100 KiB file limit + 64 KiB multipart allowance: three body chunks.
+        assert reads == 4
+
 
 class TestPromptSanitizer:
     """Tests for prompt injection protection."""
@@ -456,6 +784,14 @@ class TestPromptSanitizer:
         clean = PromptSanitizer.sanitize(dirty_prompt)
         assert "\x00" not in clean
 
+    def test_prompt_sanitization_strips_control_characters(self):
+        """Whitespace runs collapse; other non-printables are dropped."""
+        dirty_prompt = " Scene\t\n 5:\x07 fire\u200b stunt\x1b[0m "
+        assert PromptSanitizer.sanitize(dirty_prompt) == "Scene 5: fire stunt[0m"
+        assert PromptSanitizer.sanitize("Szene 5: Sprung über das Dach") == (
+            "Szene 5: Sprung über das Dach"
+        )
+
     def test_prompt_truncation(self):
         """Test prompt truncation for oversized prompts."""
         long_prompt = "A" * 15000
@@ -6,6 +6,7 @@ orchestration in isolation.
 """
 
 import base64
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -13,6 +14,7 @@ from uuid import uuid4
 import pytest
 
 from workflows.activities import (
+    _retrieve_script,
     deliver_report_activity,
     update_job_status_activity,
 )
@@ -127,6 +129,27 @@ class TestUpdateJobStatusActivity:
         assert "missing" in result["reason"]
 
 
+# ===================================================================
+# Script retrieval from the SecureBuffer
+# ===================================================================
+
+
+@pytest.mark.asyncio
+class TestRetrieveScript:
+    """Tests for _retrieve_script (raw bytes and pre-raw JSON entries)."""
+
+    async def test_returns_raw_bytes(self):
+        buf = AsyncMock()
+        buf.retrieve_bytes = AsyncMock(return_value=b"<?xml version='1.0'?><FinalDraft/>")
+        assert await _retrieve_script(buf, "eki:buf:x") == b"<?xml version='1.0'?><FinalDraft/>"
+
+    async def test_decodes_legacy_base64_json_entry(self):
+        legacy = json.dumps({"script_content": base64.b64encode(b"%PDF-1.4 x").decode()})
+        buf = AsyncMock()
+        buf.retrieve_bytes = AsyncMock(return_value=legacy.encode())
+        assert await _retrieve_script(buf, "eki:buf:x") == b"%PDF-1.4 x"
+
+
 # ===================================================================
 # deliver_report_activity — Pull mode
 # ===================================================================
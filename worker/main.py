@@ -13,6 +13,7 @@ from temporalio.worker import Worker
 
 from api.config import get_settings
 from core.logging_config import configure_logging
+from llm.factory import close_llm_providers
 from workflows.activities import (
     aggregate_report_activity,
     aggregate_script_activity,
@@ -93,6 +94,8 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Worker error: {e}", exc_info=True)
         raise
+    finally:
+        await close_llm_providers()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ plus metadata.  No screenplay content flows through Temporal history.
 """
 
 import base64
+import json
 import logging
 import time
 from datetime import timedelta
@@ -24,7 +25,7 @@ def _get_buffer() -> SecureBuffer:
     """Create a SecureBuffer bound to the global Redis + secret key."""
     settings = get_settings()
     redis_client = aioredis.from_url(
-        str(settings.redis_url),
+        settings.redis_url_s,
         decode_responses=False,
     )
     return SecureBuffer(
@@ -34,6 +35,19 @@ def _get_buffer() -> SecureBuffer:
     )
 
 
+# Entries written by API versions before raw script storage hold
+# {"script_content": "<base64>"} as JSON (json.dumps default separators).
+_LEGACY_SCRIPT_PREFIX = b'{"script_content": '
+
+
+async def _retrieve_script(buffer: SecureBuffer, ref_key: str) -> bytes:
+    """Fetch the uploaded script bytes stored by the API for *ref_key*."""
+    content = await buffer.retrieve_bytes(ref_key)
+    if content.startswith(_LEGACY_SCRIPT_PREFIX):
+        return base64.b64decode(json.loads(content)["script_content"])
+    return content
+
+
 # ===================================================================
 # FDX Activities
 # ===================================================================
@@ -52,9 +66,7 @@ async def parse_fdx_activity(job_data: dict[str, Any]) -> dict[str, Any]:
     buffer = _get_buffer()
 
     try:
-        raw_data = await buffer.retrieve(ref_key)
-        b64_content = raw_data["script_content"]
-        content_bytes = base64.b64decode(b64_content)
+        content_bytes = await _retrieve_script(buffer, ref_key)
 
         from parsers.fdx import FDXParser
 
@@ -88,9 +100,7 @@ async def extract_pdf_text_activity(job_data: dict[str, Any]) -> dict[str, Any]:
 
     buffer = _get_buffer()
 
-    raw_data = await buffer.retrieve(ref_key)
-    b64_content = raw_data["script_content"]
-    content_bytes = base64.b64decode(b64_content)
+    content_bytes = await _retrieve_script(buffer, ref_key)
 
     from parsers.pdf import extract_pdf_text
 
@@ -389,7 +399,7 @@ async def update_job_status_activity(job_data: dict[str, Any]) -> dict[str, Any]
         from core.models import JobStatus
 
         settings = get_settings()
-        engine = create_async_engine(str(settings.database_url))
+        engine = create_async_engine(settings.database_url_s)
         Session = async_sessionmaker(engine, expire_on_commit=False)
 
         values: dict[str, Any] = {"status": JobStatus(new_status)}
@@ -449,7 +459,7 @@ async def _build_kb_context(*, scene_text: str, settings: Any) -> str:
         from llm.factory import get_llm_provider
         from services.knowledge_base import KnowledgeBaseService
 
-        engine = create_async_engine(str(settings.database_url))
+        engine = create_async_engine(settings.database_url_s)
         Session = async_sessionmaker(engine, expire_on_commit=False)
 
         async with Session() as session:
@@ -763,7 +773,7 @@ async def deliver_report_activity(
         from core.models import JobStatus, ScriptFormat
 
         settings = get_settings()
-        engine = create_async_engine(str(settings.database_url))
+        engine = create_async_engine(settings.database_url_s)
         Session = async_sessionmaker(engine, expire_on_commit=False)
 
         async with Session() as session: